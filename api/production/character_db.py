@@ -10,11 +10,142 @@ Character Consistency Techniques Applied:
 
 import json
 import os
+import re
+import shutil
+import sys
+import types
 import logging
+from collections import ChainMap
+from itertools import islice
 from typing import Optional
 
+from config.settings import BIBLE_CONFIG
+
 logger = logging.getLogger("character_db")
 
+# On-disk format: {"version": N, "characters": [...]}. Version 1 is the
+# legacy bare list, saved before consistency fields were guaranteed.
+DB_SCHEMA_VERSION = 2
+
+# Identity fields used as lookup keys; interned so dict hits compare by pointer
+_INTERNED_FIELDS = ("id", "name_en", "name_ko", "anchor_name")
+
+
+# ---- Keyword Scanners ----
+# Each table is (keyword, value) in priority order: when several keywords
+# occur in the text, the earliest entry wins regardless of text position.
+
+def _compile_scanner(table: tuple) -> tuple:
+    """
+    Compile a keyword table into a single overlapping-match regex.
+
+    The zero-width lookahead reports a hit at every text position, and the
+    alternation is tried in table order, so the best-priority keyword present
+    anywhere in the text is always among the hits.
+    """
+    keywords = [kw for kw, _ in table]
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    priority = {kw: i for i, kw in enumerate(keywords)}
+    return pattern, priority, table
+
+
+def _scan_first(scanner: tuple, text: str, default=None):
+    """Return the value of the highest-priority keyword found in text."""
+    pattern, priority, table = scanner
+    hits = pattern.findall(text)
+    if not hits:
+        return default
+    return table[min(priority[kw] for kw in hits)][1]
+
+
+def _scan_all(scanner: tuple, text: str) -> list:
+    """Return the values of every keyword found in text, in table order."""
+    pattern, priority, table = scanner
+    found = {priority[kw] for kw in pattern.findall(text)}
+    return [table[i][1] for i in sorted(found)]
+
+
+def _identity(*keywords: str) -> tuple:
+    return tuple((kw, kw) for kw in keywords)
+
+
+_HAIR_COLOR_SCAN = _compile_scanner(_identity(
+    "white", "grey", "gray", "dark brown", "reddish-brown", "brown", "dark", "black", "red",
+))
+_HAIR_STYLE_SCAN = _compile_scanner(_identity(
+    "long flowing", "long", "short curly", "curly", "wavy", "shoulder-length", "balding", "flowing",
+))
+_BEARD_SCAN = _compile_scanner(_identity(
+    "long white beard", "thick grey beard", "dark bushy beard", "short well-groomed beard", "short beard",
+))
+_CLOTHING_HEAD_SCAN = _compile_scanner(_identity(
+    "helmet", "crown", "headcloth", "head covering", "veil",
+))
+_CLOTHING_FEET_SCAN = _compile_scanner(_identity("sandals", "boots", "greaves"))
+_CLOTHING_MAT_SCAN = _compile_scanner(_identity(
+    "bronze", "leather", "wool", "linen", "gold", "iron", "animal-skin", "silk",
+))
+_GENDER_SCAN = _compile_scanner((("woman", "female"), ("girl", "female")))
+_SKIN_SCAN = _compile_scanner(_identity(
+    "olive-toned", "olive", "tanned", "sun-kissed", "ruddy", "tan", "weathered",
+))
+
+
+# ---- Category Scanners ----
+# Several keywords map to one result, so each category is a named group.
+# Groups are in priority order; the lowest-numbered group found anywhere wins.
+
+def _scan_group(pattern: re.Pattern, text: str) -> Optional[str]:
+    """Return the name of the highest-priority group matched in text."""
+    best = min(pattern.finditer(text), key=lambda m: m.lastindex, default=None)
+    return best.lastgroup if best else None
+
+
+_AGE_RE = re.compile(
+    r"(?=(?P<teenager>boy|teenager)|(?P<young>young)|(?P<very_old>very old)"
+    r"|(?P<elderly>elderly|old|aged)|(?P<thirties>30s|early 30))"
+)
+_AGE_MAP = {
+    "teenager": "teenager",
+    "young": "young adult",
+    "very_old": "very old",
+    "elderly": "elderly",
+    "thirties": "early 30s",
+}
+
+_EXPR_RE = re.compile(
+    r"(?=(?P<gentle>compassionate|gentle)|(?P<brave>brave|courageous)"
+    r"|(?P<cruel>arrogant|brutal)|(?P<humble>humble)|(?P<passionate>passionate))"
+)
+_EXPR_MAP = {
+    "gentle": "gentle and compassionate",
+    "brave": "determined and courageous",
+    "cruel": "sneering and contemptuous",
+    "humble": "humble and serene",
+    "passionate": "intense and passionate",
+}
+
+# Any comma with surrounding whitespace, for building comma-free stream text
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+# Comma-separated list items, scanned lazily so long texts aren't fully split
+_LIST_ITEM_RE = re.compile(r"[^,]+")
+
+
+def _clone(value):
+    """Copy nested dict/list metadata so callers can't mutate cached entries."""
+    if isinstance(value, dict):
+        return {k: _clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    return value
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 # Default characters for Bible animations
 # Each character includes:
 #   - Standard fields: id, name_ko, name_en, appearance, clothing, props, personality_traits
@@ -154,43 +285,133 @@ DEFAULT_CHARACTERS = [
     },
 ]
 
+# Read-only views shared by every CharacterDB that starts from the defaults,
+# so mutating a returned character can't corrupt DEFAULT_CHARACTERS.
+# add_character replaces them with plain dicts (copy-on-write).
+_DEFAULT_CHARACTERS_FROZEN = tuple(
+    types.MappingProxyType(dict(ch)) for ch in DEFAULT_CHARACTERS
+)
+
+# Character Bible section; optional fields fall back via _BIBLE_MD_DEFAULTS
+_BIBLE_MD = (
+    "## {name_en} ({name_ko})\n"
+    "- **Anchor Name**: {anchor_name}\n"
+    "- **Identity**: {appearance}\n"
+    "- **Attire**: {clothing}\n"
+    "- **Props**: {props}\n"
+    "- **Personality**: {personality_traits}\n"
+    "- **Stream Description**: {stream_description}\n"
+    "- **Constraints (Negative)**: {negative_guidance}"
+)
+_BIBLE_MD_DEFAULTS = types.MappingProxyType({
+    "stream_description": "N/A",
+    "negative_guidance": "N/A",
+})
+
+# 360° reference sheet prompt (see get_character_sheet_prompt)
+_SHEET_TMPL = """Create a professional character reference sheet for {anchor}.
+
+Character Description: {stream}
+
+Clothing: {clothing}
+Props: {props}
+
+SHEET LAYOUT:
+Arrange the sheet so that the left side contains two large full-body panels of the character in a relaxed A-pose with accurate anatomy and proportions and a clear silhouette: one full-body front view and one full-body back view, with consistent scale and alignment between them.
+
+On the right side, create four portrait panels arranged in two rows: a front portrait with the face looking straight at the camera, a left-side portrait (profile or three-quarter view facing left), a right-side portrait (profile or three-quarter view facing right), and an extreme close-up face crop that clearly shows fine facial details such as eyes, eyelids or eyelashes, eyebrows, nose, mouth, skin or surface texture, and hair details.
+
+CONSISTENCY RULES:
+- Use a clean, neutral plain background so the character is clear
+- Maintain perfect identity consistency across every panel so the character always looks like the same individual
+- Keep the facial scale consistent across the three standard portraits
+- Use even spacing and clean visual separation between all panels
+- Lighting should remain consistent across the entire sheet (same direction, intensity, and softness)
+- Controlled shadows that preserve detail without dramatic mood shifts
+- Crisp, print-ready reference sheet with sharp details
+- Do NOT change the style from the original description"""
+
 
 class CharacterDB:
     """Manages Bible character data for consistent visual prompts."""
 
     def __init__(self, db_path: Optional[str] = None):
-        from config.settings import BIBLE_CONFIG
         self.db_path = db_path or BIBLE_CONFIG["character_db_path"]
         self.characters = {}
+        # Name indexes for find_by_name; rebuilt whenever characters change
+        self._by_name_ko = {}
+        self._by_name_en_lower = {}
+        # Column views for batch queries: field -> values in row order
+        self._row = {}
+        self._columns = {}
+        # Veo metadata per character id (dict + compact JSON), built at load/add time
+        self._metadata = {}
+        self._metadata_bytes = {}
+        # Per-instance memo of prompt fragments; cleared whenever characters change
+        self._fragment_cache = {}
+        # Set when in-memory characters differ from the file on disk
+        self._dirty = False
+        # Set when the file on disk could not be parsed (defaults are in memory)
+        self._unreadable = False
         self._load_or_create()
 
     def _load_or_create(self):
         """Load character DB from file or create default."""
-        if os.path.exists(self.db_path):
-            try:
-                with open(self.db_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+        try:
+            # json.loads decodes UTF-8 bytes itself; no text-mode wrapper needed
+            with open(self.db_path, "rb") as f:
+                data = json.loads(f.read())
+            if isinstance(data, dict) and data.get("version", 1) >= DB_SCHEMA_VERSION:
+                # Current format: consistency fields were filled in before saving
+                for ch in data["characters"]:
+                    self._intern_fields(ch)
+                    self.characters[ch["id"]] = ch
+            else:
                 for ch in data:
                     # Migrate old entries: add consistency fields if missing
                     self._ensure_consistency_fields(ch)
+                    self._intern_fields(ch)
                     self.characters[ch["id"]] = ch
-                logger.info(f"✅ Loaded {len(self.characters)} characters from {self.db_path}")
-                return
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to load character DB: {e}. Recreating.")
-
-        # Create default
-        for ch in DEFAULT_CHARACTERS:
+                # Re-save in the current format so the migration runs only once
+                self._dirty = True
+        except FileNotFoundError:
+            unreadable = False
+        except Exception as e:
+            unreadable = True
+            logger.warning(f"⚠️ Failed to load character DB: {e}. Using defaults; {self.db_path} left untouched.")
+        else:
+            self._rebuild_index()
+            self._precompute_metadata(self.characters.values())
+            self._save()
+            logger.info(f"✅ Loaded {len(self.characters)} characters from {self.db_path}")
+            return
+
+        # Create default (dropping anything a failed load left behind)
+        self.characters.clear()
+        for ch in _DEFAULT_CHARACTERS_FROZEN:
             self.characters[ch["id"]] = ch
+        self._rebuild_index()
+        self._precompute_metadata(self.characters.values())
+        if unreadable:
+            # Never overwrite a DB we could not parse; the user may want to repair it
+            self._unreadable = True
+            self._dirty = False
+            return
+        self._dirty = True
         self._save()
         logger.info(f"✅ Created default character DB with {len(self.characters)} characters")
 
-    def _ensure_consistency_fields(self, ch: dict):
-        """Auto-populate consistency fields if missing (backward compatibility)."""
+    def _ensure_consistency_fields(self, ch: dict) -> bool:
+        """
+        Auto-populate consistency fields if missing (backward compatibility).
+        Returns True if any field was added.
+        """
+        changed = False
         if "anchor_name" not in ch:
             # Generate a rare anchor name from existing name
             base = ch.get("name_en", ch["id"]).split("(")[0].strip()
             ch["anchor_name"] = f"{base}ael"
+            changed = True
 
         if "stream_description" not in ch:
             # Build stream from appearance + clothing (strip commas for uninterrupted flow)
@@ -198,16 +419,63 @@ class CharacterDB:
             clothing = ch.get("clothing", "")
             combined = f"{appearance} wearing {clothing}"
             # Replace commas with " and" for uninterrupted stream
-            ch["stream_description"] = combined.replace(", ", " and ")
+            ch["stream_description"] = _COMMA_RE.sub(" and ", combined).strip()
+            changed = True
 
         if "negative_guidance" not in ch:
             ch["negative_guidance"] = "distorted face, asymmetric eyes, extra limbs, deformed hands"
+            changed = True
+
+        return changed
+
+    @staticmethod
+    def _intern_fields(ch: dict):
+        """Intern identity strings loaded from JSON (see _INTERNED_FIELDS)."""
+        for key in _INTERNED_FIELDS:
+            value = ch.get(key)
+            if isinstance(value, str):
+                ch[key] = sys.intern(value)
 
     def _save(self):
-        """Save character DB to file."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        with open(self.db_path, "w", encoding="utf-8") as f:
-            json.dump(list(self.characters.values()), f, ensure_ascii=False, indent=2)
+        """
+        Save character DB to file if anything changed.
+        Writes to a temp file and renames it over the DB so a crash
+        mid-write never leaves a truncated file behind.
+        """
+        if not self._dirty:
+            return
+        self._write(self.db_path)
+        self._dirty = False
+        self._unreadable = False
+
+    def _write(self, path: str):
+        """Atomically write the in-memory characters to path in the current format."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": DB_SCHEMA_VERSION,
+                    "characters": [dict(ch) for ch in self.characters.values()],
+                },
+                f, ensure_ascii=False, indent=2,
+            )
+        os.replace(tmp_path, path)
+
+    def _rebuild_index(self):
+        """Rebuild the name lookup indexes (first character wins on collisions)."""
+        self._by_name_ko = {}
+        self._by_name_en_lower = {}
+        self._row = {cid: i for i, cid in enumerate(self.characters)}
+        self._columns = {}
+        for ch in self.characters.values():
+            # Entries missing a name are still loaded, just not findable by it
+            name_ko = ch.get("name_ko")
+            if name_ko:
+                self._by_name_ko.setdefault(name_ko, ch)
+            name_en = (ch.get("name_en") or "").lower()
+            if name_en:
+                self._by_name_en_lower.setdefault(name_en, ch)
 
     def get(self, character_id: str) -> Optional[dict]:
         """Get character by ID."""
@@ -216,12 +484,13 @@ class CharacterDB:
     def find_by_name(self, name: str) -> Optional[dict]:
         """Find character by Korean or English name (case-insensitive)."""
         name_lower = name.lower().strip()
-        for ch in self.characters.values():
-            if (ch["name_ko"] == name or
-                ch["name_en"].lower() == name_lower or
-                ch["id"] == name_lower):
-                return ch
-        return None
+        return (self.characters.get(name_lower) or
+                self._by_name_ko.get(name) or
+                self._by_name_en_lower.get(name_lower))
+
+    def _resolve(self, character_id: str) -> Optional[dict]:
+        """Look up a character by ID, falling back to name matching."""
+        return self.characters.get(character_id) or self.find_by_name(character_id)
 
     # ---- Standard Prompt Fragment (comma-separated, backward compatible) ----
 
@@ -230,26 +499,28 @@ class CharacterDB:
         Generate a visual description fragment for embedding into image/video prompts.
         Uses standard comma-separated format.
         """
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        key = ("prompt", character_id)
+        if key in self._fragment_cache:
+            return self._fragment_cache[key]
+
+        ch = self._resolve(character_id)
         if not ch:
             return f"A biblical character named {character_id}."
 
-        return (
+        fragment = (
             f"{ch['name_en']} ({ch['name_ko']}): "
             f"{ch['appearance']} "
             f"Wearing {ch['clothing']}. "
             f"{ch['props']}."
         )
+        self._fragment_cache[key] = fragment
+        return fragment
 
     # ---- Character Consistency Methods ----
 
     def get_anchor_name(self, character_id: str) -> str:
         """Get the rare-name anchor for latent space fixation."""
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        ch = self._resolve(character_id)
         if not ch:
             return character_id
         return ch.get("anchor_name", ch["name_en"])
@@ -260,94 +531,114 @@ class CharacterDB:
         Returns a single flowing phrase with no internal commas,
         preventing attribute binding errors in the text encoder.
         """
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        key = ("stream", character_id)
+        if key in self._fragment_cache:
+            return self._fragment_cache[key]
+
+        ch = self._resolve(character_id)
         if not ch:
             return f"A biblical character named {character_id}"
-        return ch.get("stream_description", self.get_prompt_fragment(character_id))
+
+        fragment = ch.get("stream_description", self.get_prompt_fragment(character_id))
+        self._fragment_cache[key] = fragment
+        return fragment
 
     def get_negative_guidance(self, character_id: str) -> str:
         """Get per-character negative guidance keywords."""
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        ch = self._resolve(character_id)
         if not ch:
             return ""
         return ch.get("negative_guidance", "")
 
     def get_all_prompt_fragments(self, character_ids: list) -> str:
         """Generate prompt fragments for multiple characters."""
-        fragments = []
-        for cid in character_ids:
-            frag = self.get_prompt_fragment(cid)
-            fragments.append(frag)
-        return "\n".join(fragments)
+        return "\n".join(map(self.get_prompt_fragment, character_ids))
 
     def get_all_stream_fragments(self, character_ids: list) -> str:
         """Generate uninterrupted stream fragments for multiple characters."""
-        fragments = []
-        for cid in character_ids:
-            frag = self.get_stream_fragment(cid)
-            fragments.append(frag)
-        return "\n\n".join(fragments)
+        return "\n\n".join(map(self.get_stream_fragment, character_ids))
 
     def get_character_bible_markdown(self, character_ids: list) -> str:
         """
         Generate a structured Character Bible in Markdown format.
         Used to inject into LLM system prompts for consistent prompt generation.
         """
-        sections = []
-        for cid in character_ids:
-            ch = self.characters.get(cid)
-            if not ch:
-                ch = self.find_by_name(cid)
-            if not ch:
-                continue
-
-            section = f"""## {ch['name_en']} ({ch['name_ko']})
-- **Anchor Name**: {ch.get('anchor_name', ch['name_en'])}
-- **Identity**: {ch['appearance']}
-- **Attire**: {ch['clothing']}
-- **Props**: {ch['props']}
-- **Personality**: {ch['personality_traits']}
-- **Stream Description**: {ch.get('stream_description', 'N/A')}
-- **Constraints (Negative)**: {ch.get('negative_guidance', 'N/A')}"""
-            sections.append(section)
-
-        return "\n\n".join(sections)
+        resolved = (self._resolve(cid) for cid in character_ids)
+        return "\n\n".join(
+            _BIBLE_MD.format_map(
+                ChainMap(ch, {"anchor_name": ch["name_en"]}, _BIBLE_MD_DEFAULTS)
+            )
+            for ch in resolved if ch
+        )
 
     def get_json_metadata(self, character_id: str) -> dict:
         """
         Generate structured JSON metadata for Veo 3.1 character locking.
         Follows the Gemini Gem Image Analysis Specialist schema for
         precise character identity preservation across scenes.
+
+        Metadata is precomputed when characters are loaded or added; a fresh
+        copy is returned so callers may annotate it freely.
         """
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        ch = self._resolve(character_id)
         if not ch:
             return {"name": character_id}
 
-        # Parse structured fields from appearance/clothing text
-        hair_info = self._parse_hair(ch["appearance"])
-        clothing_info = self._parse_clothing(ch["clothing"])
-        age_info = self._extract_age(ch["appearance"])
+        meta = self._metadata.get(ch["id"])
+        if meta is None:
+            meta = self._build_json_metadata(ch)
+        return _clone(meta)
+
+    def get_json_metadata_bytes(self, character_id: str) -> bytes:
+        """
+        Get the character's Veo metadata as compact UTF-8 JSON.
+        Serialized once per character, for callers that write it straight
+        into a request body.
+        """
+        ch = self._resolve(character_id)
+        if not ch:
+            return _dump_json_bytes({"name": character_id})
+
+        data = self._metadata_bytes.get(ch["id"])
+        if data is None:
+            data = _dump_json_bytes(self._build_json_metadata(ch))
+        return data
+
+    def _precompute_metadata(self, characters):
+        """Build and store Veo metadata for the given characters."""
+        for ch in characters:
+            try:
+                meta = self._build_json_metadata(ch)
+            except KeyError:
+                # Incomplete entry: leave it to get_json_metadata to report
+                self._metadata.pop(ch["id"], None)
+                self._metadata_bytes.pop(ch["id"], None)
+                continue
+            self._metadata[ch["id"]] = meta
+            self._metadata_bytes[ch["id"]] = _dump_json_bytes(meta)
+
+    def _build_json_metadata(self, ch: dict) -> dict:
+        """Build the Veo metadata dict for a resolved character."""
+        # Lowercase each source text once; the parse helpers take it pre-lowered
+        traits = ch.get("personality_traits", "")
+        app_lower = ch["appearance"].lower()
+        cloth_lower = ch["clothing"].lower()
+        traits_lower = traits.lower()
 
         return {
             "name": ch.get("anchor_name", ch["name_en"]),
-            "age": age_info,
-            "gender": self._extract_gender(ch["appearance"]),
+            "age": self._extract_age(app_lower),
+            "gender": self._extract_gender(app_lower),
             "ethnicity": "Middle Eastern / Biblical",
-            "skin_tone": self._extract_skin_tone(ch["appearance"]),
-            "hair": hair_info,
-            "clothing": clothing_info,
+            "skin_tone": self._extract_skin_tone(app_lower),
+            "hair": self._parse_hair(app_lower),
+            "clothing": self._parse_clothing(ch["clothing"], cloth_lower),
             "pose": "natural standing",
-            "facial_expression": self._extract_expression(ch.get("personality_traits", "")),
+            "facial_expression": self._extract_expression(traits_lower),
             "accessories": self._extract_list_field(ch.get("props", "")),
             "held_objects": [],
-            "emotions": self._extract_list_field(ch.get("personality_traits", "")),
-            "body_language": "confident" if "brave" in ch.get("personality_traits", "").lower() else "calm",
+            "emotions": self._extract_list_field(traits),
+            "body_language": "confident" if "brave" in traits_lower else "calm",
             "stream_description": ch.get("stream_description", ""),
             "constraints": {
                 "negative": ch.get("negative_guidance", ""),
@@ -355,116 +646,95 @@ class CharacterDB:
             },
         }
 
-    def _parse_hair(self, appearance: str) -> dict:
-        """Extract hair attributes from appearance text."""
-        hair = {"style": "natural", "color": "dark"}
-        app_lower = appearance.lower()
-        # Color
-        for color in ["white", "grey", "gray", "dark brown", "reddish-brown", "brown", "dark", "black", "red"]:
-            if color in app_lower:
-                hair["color"] = color
-                break
-        # Style
-        for style in ["long flowing", "long", "short curly", "curly", "wavy", "shoulder-length", "balding", "flowing"]:
-            if style in app_lower:
-                hair["style"] = style
-                break
+    def _parse_hair(self, app_lower: str) -> dict:
+        """Extract hair attributes from lowercased appearance text."""
+        hair = {
+            "style": _scan_first(_HAIR_STYLE_SCAN, app_lower, "natural"),
+            "color": _scan_first(_HAIR_COLOR_SCAN, app_lower, "dark"),
+        }
         # Extras
         if "beard" in app_lower:
             hair["beard"] = True
-            for b in ["long white beard", "thick grey beard", "dark bushy beard", "short well-groomed beard", "short beard"]:
-                if b in app_lower:
-                    hair["beard_description"] = b
-                    break
+            beard = _scan_first(_BEARD_SCAN, app_lower)
+            if beard:
+                hair["beard_description"] = beard
         return hair
 
-    def _parse_clothing(self, clothing: str) -> dict:
-        """Extract clothing structure from text."""
-        result = {
-            "head": "",
-            "torso": "",
+    def _parse_clothing(self, clothing: str, cloth_lower: str) -> dict:
+        """Extract clothing structure from text (original and lowercased)."""
+        return {
+            "head": _scan_first(_CLOTHING_HEAD_SCAN, cloth_lower, ""),
+            # Torso is the main description
+            "torso": clothing.split(".")[0] if "." in clothing else clothing,
             "legs": "",
-            "feet": "",
-            "materials": [],
+            "feet": _scan_first(_CLOTHING_FEET_SCAN, cloth_lower, ""),
+            "materials": _scan_all(_CLOTHING_MAT_SCAN, cloth_lower),
         }
-        cloth_lower = clothing.lower()
-        # Head
-        for h in ["helmet", "crown", "headcloth", "head covering", "veil"]:
-            if h in cloth_lower:
-                result["head"] = h
-                break
-        # Feet
-        for f in ["sandals", "boots", "greaves"]:
-            if f in cloth_lower:
-                result["feet"] = f
-                break
-        # Materials
-        for m in ["bronze", "leather", "wool", "linen", "gold", "iron", "animal-skin", "silk"]:
-            if m in cloth_lower:
-                result["materials"].append(m)
-        # Torso is the main description
-        result["torso"] = clothing.split(".")[0] if "." in clothing else clothing
-        return result
-
-    def _extract_age(self, appearance: str) -> str:
-        """Extract approximate age from appearance description."""
-        app_lower = appearance.lower()
-        if "boy" in app_lower or "teenager" in app_lower:
-            return "teenager"
-        elif "young" in app_lower:
-            return "young adult"
-        elif "very old" in app_lower:
-            return "very old"
-        elif "elderly" in app_lower or "old" in app_lower or "aged" in app_lower:
-            return "elderly"
-        elif "30s" in app_lower or "early 30" in app_lower:
-            return "early 30s"
-        return "adult"
-
-    def _extract_gender(self, appearance: str) -> str:
-        app_lower = appearance.lower()
-        if "woman" in app_lower or "girl" in app_lower:
-            return "female"
-        return "male"
-
-    def _extract_skin_tone(self, appearance: str) -> str:
-        app_lower = appearance.lower()
-        for tone in ["olive-toned", "olive", "tanned", "sun-kissed", "ruddy", "tan", "weathered"]:
-            if tone in app_lower:
-                return tone
-        return "olive"
-
-    def _extract_expression(self, traits: str) -> str:
-        traits_lower = traits.lower()
-        if "compassionate" in traits_lower or "gentle" in traits_lower:
-            return "gentle and compassionate"
-        elif "brave" in traits_lower or "courageous" in traits_lower:
-            return "determined and courageous"
-        elif "arrogant" in traits_lower or "brutal" in traits_lower:
-            return "sneering and contemptuous"
-        elif "humble" in traits_lower:
-            return "humble and serene"
-        elif "passionate" in traits_lower:
-            return "intense and passionate"
-        return "calm"
+
+    def _extract_age(self, app_lower: str) -> str:
+        """Extract approximate age from lowercased appearance description."""
+        group = _scan_group(_AGE_RE, app_lower)
+        return _AGE_MAP[group] if group else "adult"
+
+    def _extract_gender(self, app_lower: str) -> str:
+        return _scan_first(_GENDER_SCAN, app_lower, "male")
+
+    def _extract_skin_tone(self, app_lower: str) -> str:
+        return _scan_first(_SKIN_SCAN, app_lower, "olive")
+
+    def _extract_expression(self, traits_lower: str) -> str:
+        group = _scan_group(_EXPR_RE, traits_lower)
+        return _EXPR_MAP[group] if group else "calm"
 
     def _extract_list_field(self, text: str) -> list:
-        """Extract a comma-separated text into a list."""
+        """Extract a comma-separated text into a list (first 5 non-empty items)."""
         if not text:
             return []
-        return [item.strip() for item in text.split(",") if item.strip()][:5]
+        items = (m.group().strip() for m in _LIST_ITEM_RE.finditer(text))
+        return list(islice(filter(None, items), 5))
 
     def add_character(self, character: dict):
         """Add or update a character in the DB."""
+        if isinstance(character, types.MappingProxyType):
+            # Copy-on-write for frozen default entries
+            character = dict(character)
         self._ensure_consistency_fields(character)
+        self._intern_fields(character)
+        existing = self.characters.get(character["id"])
+        # Same object may have been edited in place, so only skip equal copies
+        if existing is not character and existing == character:
+            logger.info(f"⏭️ Character unchanged: {character['id']}")
+            return
         self.characters[character["id"]] = character
+        self._dirty = True
+        self._rebuild_index()
+        self._precompute_metadata([character])
+        self._fragment_cache.clear()
         self._save()
         logger.info(f"✅ Added/Updated character: {character['id']}")
 
+    def get_column(self, field: str, character_ids: Optional[list] = None) -> list:
+        """
+        Get a single field for many characters at once.
+        Returns values for every character in DB order, or for the given IDs
+        (None where the ID is unknown). Columns are built on first use.
+        """
+        col = self._columns.get(field)
+        if col is None:
+            col = [ch.get(field) for ch in self.characters.values()]
+            self._columns[field] = col
+        if character_ids is None:
+            return list(col)
+        row = self._row
+        return [col[row[cid]] if cid in row else None for cid in character_ids]
+
     def list_all(self) -> list:
         """List all character IDs and names."""
-        return [(ch["id"], ch["name_ko"], ch["name_en"])
-                for ch in self.characters.values()]
+        return list(zip(
+            self.get_column("id"),
+            self.get_column("name_ko"),
+            self.get_column("name_en"),
+        ))
 
     def get_character_sheet_prompt(self, character_id: str) -> str:
         """
@@ -477,40 +747,29 @@ class CharacterDB:
         2. Analyze with Gemini Gem → extract JSON metadata
         3. Use metadata in scene prompts for Veo 3.1
         """
-        ch = self.characters.get(character_id)
-        if not ch:
-            ch = self.find_by_name(character_id)
+        ch = self._resolve(character_id)
         if not ch:
             return f"Character reference sheet for {character_id}"
 
         anchor = ch.get("anchor_name", ch["name_en"])
         stream = ch.get("stream_description", ch["appearance"])
 
-        return f"""Create a professional character reference sheet for {anchor}.
-
-Character Description: {stream}
-
-Clothing: {ch['clothing']}
-Props: {ch.get('props', 'None')}
-
-SHEET LAYOUT:
-Arrange the sheet so that the left side contains two large full-body panels of the character in a relaxed A-pose with accurate anatomy and proportions and a clear silhouette: one full-body front view and one full-body back view, with consistent scale and alignment between them.
-
-On the right side, create four portrait panels arranged in two rows: a front portrait with the face looking straight at the camera, a left-side portrait (profile or three-quarter view facing left), a right-side portrait (profile or three-quarter view facing right), and an extreme close-up face crop that clearly shows fine facial details such as eyes, eyelids or eyelashes, eyebrows, nose, mouth, skin or surface texture, and hair details.
-
-CONSISTENCY RULES:
-- Use a clean, neutral plain background so the character is clear
-- Maintain perfect identity consistency across every panel so the character always looks like the same individual
-- Keep the facial scale consistent across the three standard portraits
-- Use even spacing and clean visual separation between all panels
-- Lighting should remain consistent across the entire sheet (same direction, intensity, and softness)
-- Controlled shadows that preserve detail without dramatic mood shifts
-- Crisp, print-ready reference sheet with sharp details
-- Do NOT change the style from the original description"""
+        return _SHEET_TMPL.format_map({
+            "anchor": anchor,
+            "stream": stream,
+            "clothing": ch["clothing"],
+            "props": ch.get("props", "None"),
+        })
 
     def copy_to_run(self, run_db_path: str):
         """Copy the character DB to a specific run directory for reproducibility."""
-        import shutil
+        if self._unreadable:
+            # The file on disk is not what this run used; snapshot the in-memory defaults
+            self._write(run_db_path)
+            logger.info(f"📋 Character DB (in-memory defaults) written to {run_db_path}")
+            return
         os.makedirs(os.path.dirname(run_db_path), exist_ok=True)
-        shutil.copy2(self.db_path, run_db_path)
+        # Content is the artifact; copyfile skips the timestamp/permission
+        # syscalls of copy2 and uses os.sendfile on Linux
+        shutil.copyfile(self.db_path, run_db_path)
         logger.info(f"📋 Character DB copied to {run_db_path}")
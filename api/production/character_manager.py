@@ -12,12 +12,17 @@ Usage:
 """
 
 import asyncio
+import functools
+import hashlib
 import os
 import sys
 import json
 import re
 import shutil
 import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
 from api.production.project_manager import ProjectManager
@@ -33,6 +38,163 @@ logging.basicConfig(
 )
 logger = logging.getLogger("CharacterManager")
 
+# Max in-flight Gemini text requests during anchor generation
+ANCHOR_CONCURRENCY = 4
+# Max in-flight image requests during sheet generation
+SHEET_CONCURRENCY = 6
+# Worker threads for per-chapter character_metadata.json writes
+METADATA_WRITE_WORKERS = 8
+# Scene key listing the character names whose anchors were injected into it
+INJECTED_SENTINEL = "_anchors_injected"
+
+# Common character ID variants -> canonical names
+_CHAR_ID_MAP = {
+    "DAVID_SHEPHERD_YOUTHFUL": "DAVID",
+    "DAVID_YOUNG_WARRIOR": "DAVID",
+    "DAVID_WARRIOR": "DAVID",
+    "david_young": "DAVID",
+    "David": "DAVID",
+    "KING SAUL": "SAUL",
+    "KING_SAUL": "SAUL",
+    "saul_king": "SAUL",
+    "Saul": "SAUL",
+    "jonathan_prince": "JONATHAN",
+    "Jonathan": "JONATHAN",
+    "michal_princess": "MICHAL",
+    "Michal": "MICHAL",
+    "SAMUEL_PROPHET_OLD_WISE": "SAMUEL",
+    "Samuel": "SAMUEL",
+    "JESSE_ELDER_FATHER": "JESSE",
+    "ELIAB_SON_TALL_STRONG": "ELIAB",
+    "ELIAB_SON": "ELIAB",
+    "ABINADAB_SON": "ABINADAB",
+    "SHAMMAH_SON": "SHAMMAH",
+    "GOD_VOICE_UNSEEN": "GOD_VOICE",
+    "EVIL_SPIRIT_SHADOW_PRESENCE": "EVIL_SPIRIT",
+    "KING SAUL_MIDDLE_AGED_BEARDED_ROYAL_ROBES_CROWN_SWORD": "SAUL",
+    "DAVID_LOYAL_FOLLOWERS_ROUGH_APPEARANCE_VARIOUS_AGES_SIMPLE_TUNICS_LEATHER_ARMOR_SWORDS_SPEARS": "DAVIDS_FOLLOWERS",
+    "DAVID'S MEN": "DAVIDS_FOLLOWERS",
+    "DAVID'S_MEN": "DAVIDS_FOLLOWERS",
+    "David's Loyal Men": "DAVIDS_FOLLOWERS",
+    "SAUL_KING_TROUBLED": "SAUL",
+    "King Saul": "SAUL",
+    "King Achish": "ACHISH",
+    "Achish": "ACHISH",
+}
+
+# Default normalization: spaces -> underscores, drop apostrophes
+_CHAR_ID_TRANSLATE = str.maketrans({" ": "_", "'": None})
+# Long descriptive suffixes; everything from the first one on is removed
+_CHAR_ID_SUFFIX_RE = re.compile(r"_(?:MIDDLE_AGED|CLEAN_SHAVEN|ROUGH_APPEARANCE)[\s\S]*")
+# Outermost {...} block in a model response (tolerates prose or fences around it)
+_JSON_BLOCK_RE = re.compile(r"\{[\s\S]*\}")
+
+# Era-specific character reference sheet prompt (see generate_sheets)
+_SHEET_PROMPT_TMPL = """Create a professional character reference sheet for {cid} ({era} era, age {age}).
+
+Character Description: {visual_anchor}
+
+SHEET LAYOUT:
+Arrange the sheet so that the left side contains two large full-body panels of the character in a relaxed A-pose with accurate anatomy and proportions and a clear silhouette: one full-body front view and one full-body back view, with consistent scale and alignment between them.
+
+On the right side, create four portrait panels arranged in two rows: a front portrait with the face looking straight at the camera, a left-side portrait (profile or three-quarter view facing left), a right-side portrait (profile or three-quarter view facing right), and an extreme close-up face crop that clearly shows fine facial details such as eyes, eyelids or eyelashes, eyebrows, nose, mouth, skin or surface texture, and hair details.
+
+CONSISTENCY RULES:
+- Use a clean, neutral plain background so the character is clear
+- Maintain perfect identity consistency across every panel so the character always looks like the same individual
+- Keep the facial scale consistent across the three standard portraits
+- Use even spacing and clean visual separation between all panels
+- Lighting should remain consistent across the entire sheet (same direction, intensity, and softness)
+- Controlled shadows that preserve detail without dramatic mood shifts
+- Crisp, print-ready reference sheet with sharp details
+- Do NOT change the style from the original description"""
+
+
+def _read_json(path: str):
+    """Load a JSON file from raw bytes (json.loads detects UTF-8 itself)."""
+    return json.loads(Path(path).read_bytes())
+
+
+def _write_if_changed(path: str, data: bytes) -> bool:
+    """
+    Atomically replace path with data unless it already holds exactly that.
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _write_json(path: str, data) -> bool:
+    """Write data as pretty-printed UTF-8 JSON (skipped if unchanged)."""
+    payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return _write_if_changed(path, payload)
+
+
+def _file_size(path: str) -> int:
+    """Size of a file in bytes from a single stat call, or -1 if it is missing."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
+@functools.lru_cache(maxsize=64)
+def _anchor_name_pattern(names: tuple) -> re.Pattern:
+    """
+    One alternation matching any of names (longest first) that is not already
+    followed by a parenthetical. Cached: chapters often share a cast.
+    """
+    return re.compile(
+        r'\b(' + "|".join(map(re.escape, names)) + r')\b(?!\s*\()',
+        re.IGNORECASE,
+    )
+
+
+async def _aread_json(path: str):
+    """_read_json on a worker thread so the event loop keeps serving requests."""
+    return await asyncio.to_thread(_read_json, path)
+
+
+async def _awrite_json(path: str, data) -> None:
+    """_write_json on a worker thread so the event loop keeps serving requests."""
+    await asyncio.to_thread(_write_json, path, data)
+
+
+def _iter_appearances(scenes: list):
+    """
+    Yield (cid, objects, objects_lower) for every character of every scene.
+    Each scene's objects text is fetched and lowercased once.
+    """
+    for scene in scenes:
+        objects_text = scene.get("objects", "")
+        objects_lower = objects_text.lower()
+        for cid in scene.get("characters") or ():
+            yield cid, objects_text, objects_lower
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_char_id(cid: str) -> str:
+    """Normalize character IDs to canonical form (memoized; IDs repeat per scene)."""
+    # Strip known suffixes/prefixes
+    normalized = cid.strip()
+
+    # Map common variants to canonical names
+    if normalized in _CHAR_ID_MAP:
+        return _CHAR_ID_MAP[normalized]
+
+    # Default: uppercase, strip long descriptive suffixes
+    upper = normalized.upper().translate(_CHAR_ID_TRANSLATE)
+    return _CHAR_ID_SUFFIX_RE.sub("", upper)
+
 
 class CharacterManager:
     """
@@ -61,9 +223,36 @@ class CharacterManager:
             self.proj.pm.root, "character_visual_anchors.json"
         )
 
+        # Gemini anchor responses keyed by prompt hash; refresh_anchors bypasses it
+        self.anchor_cache_dir = os.path.join(self.proj.pm.root, ".anchor_cache")
+        self.refresh_anchors = False
+
         self.timeline = {}
         self.visual_anchors = {}
 
+        # Chapter list and per-index ChapterPathManagers, resolved once per run
+        self._all_chapters = self.proj.get_all_chapters()
+        self._cpms = {}
+
+        # Parsed script.json per chapter index (None if missing), shared by all steps
+        self._scripts = {}
+
+    def _cpm(self, idx: int):
+        """get_chapter_pm() memoized per chapter index (None if not found)."""
+        if idx not in self._cpms:
+            self._cpms[idx] = self.proj.get_chapter_pm(idx)
+        return self._cpms[idx]
+
+    def _load_script(self, idx: int) -> Optional[dict]:
+        """Load a chapter's script.json once per run; later calls reuse it."""
+        if idx not in self._scripts:
+            cpm = self._cpm(idx)
+            try:
+                self._scripts[idx] = _read_json(os.path.join(cpm.root, "script.json"))
+            except FileNotFoundError:
+                self._scripts[idx] = None
+        return self._scripts[idx]
+
     # ------------------------------------------------------------------ #
     #  Step 1: Character Timeline Analysis
     # ------------------------------------------------------------------ #
@@ -86,71 +275,61 @@ class CharacterManager:
         """
         logger.info("📊 Step 1: Analyzing character timeline across all chapters...")
 
-        char_data = {}  # char_id -> { chapters: {ch_idx: count}, descriptions: [...] }
+        # Per-character columns, keyed by normalized char_id
+        chapter_counts = defaultdict(Counter)  # char_id -> {ch_idx: count}
+        original_ids = defaultdict(set)        # char_id -> raw IDs seen in scripts
+        descriptions = defaultdict(list)       # char_id -> [{chapter, text}, ...]
 
-        for ch in self.proj.get_all_chapters():
+        for ch in self._all_chapters:
             idx = ch["index"]
             if idx == 0:
                 continue
 
-            cpm = self.proj.get_chapter_pm(idx)
-            script_path = os.path.join(cpm.root, "script.json")
-            if not os.path.exists(script_path):
+            script = self._load_script(idx)
+            if script is None:
                 continue
 
-            with open(script_path, "r", encoding="utf-8") as f:
-                script = json.load(f)
+            for cid, objects_text, objects_lower in _iter_appearances(
+                script.get("scenes", [])
+            ):
+                # Normalize character ID
+                norm_id = _normalize_char_id(cid)
 
-            for scene in script.get("scenes", []):
-                for cid in scene.get("characters", []):
-                    # Normalize character ID
-                    norm_id = self._normalize_char_id(cid)
-
-                    if norm_id not in char_data:
-                        char_data[norm_id] = {
-                            "original_ids": set(),
-                            "chapters": {},
-                            "descriptions": [],
-                        }
-
-                    char_data[norm_id]["original_ids"].add(cid)
-                    char_data[norm_id]["chapters"][idx] = (
-                        char_data[norm_id]["chapters"].get(idx, 0) + 1
-                    )
+                chapter_counts[norm_id][idx] += 1
+                original_ids[norm_id].add(cid)
 
-                    # Collect scene descriptions for this character
-                    objects_text = scene.get("objects", "")
-                    if cid.lower() in objects_text.lower():
-                        char_data[norm_id]["descriptions"].append({
-                            "chapter": idx,
-                            "text": objects_text,
-                        })
+                # Collect scene descriptions for this character
+                if cid.lower() in objects_lower:
+                    descriptions[norm_id].append({
+                        "chapter": idx,
+                        "text": objects_text,
+                    })
 
         # Build timeline
         self.timeline = {}
-        for norm_id, data in sorted(
-            char_data.items(),
-            key=lambda x: sum(x[1]["chapters"].values()),
+        totals = {cid: sum(counts.values()) for cid, counts in chapter_counts.items()}
+        for norm_id, counts in sorted(
+            chapter_counts.items(),
+            key=lambda x: totals[x[0]],
             reverse=True,
         ):
-            total = sum(data["chapters"].values())
-            chapter_list = sorted(data["chapters"].keys())
+            total = totals[norm_id]
+            chapter_list = sorted(counts.keys())
 
             self.timeline[norm_id] = {
                 "total_appearances": total,
-                "original_ids": sorted(data["original_ids"]),
-                "chapters": data["chapters"],
+                "original_ids": sorted(original_ids[norm_id]),
+                "chapters": dict(counts),
                 "chapter_list": chapter_list,
                 "phases": [],  # Will be populated in step 2
             }
 
         # Save timeline
-        with open(self.timeline_path, "w", encoding="utf-8") as f:
-            json.dump(self.timeline, f, ensure_ascii=False, indent=2)
+        _write_json(self.timeline_path, self.timeline)
 
         logger.info(
             f"✅ Timeline: {len(self.timeline)} characters across "
-            f"{len(self.proj.get_all_chapters())-1} chapters"
+            f"{len(self._all_chapters)-1} chapters"
         )
         for cid, data in list(self.timeline.items())[:10]:
             chs = ",".join(str(c) for c in data["chapter_list"])
@@ -158,57 +337,6 @@ class CharacterManager:
 
         return self.timeline
 
-    def _normalize_char_id(self, cid: str) -> str:
-        """Normalize character IDs to canonical form."""
-        # Strip known suffixes/prefixes
-        normalized = cid.strip()
-
-        # Map common variants to canonical names
-        mappings = {
-            "DAVID_SHEPHERD_YOUTHFUL": "DAVID",
-            "DAVID_YOUNG_WARRIOR": "DAVID",
-            "DAVID_WARRIOR": "DAVID",
-            "david_young": "DAVID",
-            "David": "DAVID",
-            "KING SAUL": "SAUL",
-            "KING_SAUL": "SAUL",
-            "saul_king": "SAUL",
-            "Saul": "SAUL",
-            "jonathan_prince": "JONATHAN",
-            "Jonathan": "JONATHAN",
-            "michal_princess": "MICHAL",
-            "Michal": "MICHAL",
-            "SAMUEL_PROPHET_OLD_WISE": "SAMUEL",
-            "Samuel": "SAMUEL",
-            "JESSE_ELDER_FATHER": "JESSE",
-            "ELIAB_SON_TALL_STRONG": "ELIAB",
-            "ELIAB_SON": "ELIAB",
-            "ABINADAB_SON": "ABINADAB",
-            "SHAMMAH_SON": "SHAMMAH",
-            "GOD_VOICE_UNSEEN": "GOD_VOICE",
-            "EVIL_SPIRIT_SHADOW_PRESENCE": "EVIL_SPIRIT",
-            "KING SAUL_MIDDLE_AGED_BEARDED_ROYAL_ROBES_CROWN_SWORD": "SAUL",
-            "DAVID_LOYAL_FOLLOWERS_ROUGH_APPEARANCE_VARIOUS_AGES_SIMPLE_TUNICS_LEATHER_ARMOR_SWORDS_SPEARS": "DAVIDS_FOLLOWERS",
-            "DAVID'S MEN": "DAVIDS_FOLLOWERS",
-            "DAVID'S_MEN": "DAVIDS_FOLLOWERS",
-            "David's Loyal Men": "DAVIDS_FOLLOWERS",
-            "SAUL_KING_TROUBLED": "SAUL",
-            "King Saul": "SAUL",
-            "King Achish": "ACHISH",
-            "Achish": "ACHISH",
-        }
-
-        if normalized in mappings:
-            return mappings[normalized]
-
-        # Default: uppercase, strip long descriptive suffixes
-        upper = normalized.upper().replace(" ", "_").replace("'", "")
-        # Remove long suffixes after known patterns
-        for suffix in ["_MIDDLE_AGED", "_CLEAN_SHAVEN", "_ROUGH_APPEARANCE"]:
-            if suffix in upper:
-                upper = upper[:upper.index(suffix)]
-        return upper
-
     # ------------------------------------------------------------------ #
     #  Step 2: Generate Visual Anchors via Gemini
     # ------------------------------------------------------------------ #
@@ -226,13 +354,12 @@ class CharacterManager:
 
         if not self.timeline:
             if os.path.exists(self.timeline_path):
-                with open(self.timeline_path, "r", encoding="utf-8") as f:
-                    self.timeline = json.load(f)
+                self.timeline = await _aread_json(self.timeline_path)
             else:
                 self.analyze_timeline()
 
-        # Prepare character summaries for Gemini
-        char_summaries = []
+        # Prepare one summary per major character for Gemini
+        char_summaries = {}
         for cid, data in self.timeline.items():
             if data["total_appearances"] < 2:
                 continue
@@ -249,7 +376,7 @@ class CharacterManager:
                     f"Clothing: {ch_data.get('clothing', '')}"
                 )
 
-            char_summaries.append(
+            char_summaries[cid] = (
                 f"- {cid}: appears {data['total_appearances']} times in chapters "
                 f"{chapters}. {existing_desc}"
             )
@@ -258,18 +385,55 @@ class CharacterManager:
             logger.info("⏭️ No major characters found for anchor generation")
             return {}
 
-        prompt = f"""Analyze these Bible animation characters and their chapter appearances.
-For each character, determine their life stages (eras) based on the story progression.
+        # Characters are independent, so request them concurrently
+        sem = asyncio.Semaphore(ANCHOR_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._anchor_for_char(cid, summary, sem)
+              for cid, summary in char_summaries.items()),
+            return_exceptions=True,
+        )
+
+        self.visual_anchors = {}
+        for cid, result in zip(char_summaries, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Gemini visual anchor generation failed for {cid}: {result}")
+                continue
+            self.visual_anchors.update(result)
+
+        # Merge phases back into timeline
+        for cid, anchor_data in self.visual_anchors.items():
+            if cid in self.timeline:
+                self.timeline[cid]["phases"] = anchor_data.get("phases", [])
+
+        # Save
+        await asyncio.gather(
+            _awrite_json(self.anchors_path, self.visual_anchors),
+            _awrite_json(self.timeline_path, self.timeline),
+        )
+
+        logger.info(f"✅ Visual anchors generated for {len(self.visual_anchors)} characters")
+        for cid, data in self.visual_anchors.items():
+            phases = data.get("phases", [])
+            eras = ", ".join(p["era"] for p in phases)
+            logger.info(f"   {cid}: {len(phases)} era(s) — {eras}")
+
+        return self.visual_anchors
+
+    async def _anchor_for_char(self, cid: str, summary: str,
+                               sem: asyncio.Semaphore) -> dict:
+        """Ask Gemini for one character's era phases. Returns {cid: {...}} or {}."""
+        prompt = f"""Analyze this Bible animation character and their chapter appearances.
+Determine their life stages (eras) based on the story progression.
 
 Project: {self.proj.project_data.get('title', '')}
 Scripture: {self.proj.project_data.get('scripture_ref', '')}
 
-Characters:
-{chr(10).join(char_summaries)}
+Character:
+{summary}
 
-For each character, output a JSON object with this structure:
+Output a JSON object with this structure:
 {{
-  "CHARACTER_NAME": {{
+  "{cid}": {{
     "phases": [
       {{
         "era": "short_era_label",
@@ -282,7 +446,7 @@ For each character, output a JSON object with this structure:
 }}
 
 Rules:
-- If a character doesn't change visually across chapters, use a single phase with era "single"
+- If the character doesn't change visually across chapters, use a single phase with era "single"
 - David specifically changes: shepherd boy (ch1-3) → young warrior (ch4-9) → emerging king (ch10-12)
 - Saul changes: powerful king (ch1-4) → increasingly troubled (ch5-9) → tragic decline (ch10)
 - Minor characters (< 5 appearances) get a single "single" phase
@@ -291,38 +455,30 @@ Rules:
 
 Return ONLY the JSON object, no markdown formatting."""
 
-        try:
+        # Same prompt (timeline + project unchanged) -> reuse the previous answer
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        cache_path = os.path.join(self.anchor_cache_dir, f"{cache_key}.json")
+        if not self.refresh_anchors:
+            try:
+                cached = await _aread_json(cache_path)
+                logger.info(f"⏭️ {cid}: Using cached visual anchors")
+                return cached
+            except (FileNotFoundError, ValueError):
+                pass
+
+        async with sem:
             response = await self.ai.generate_text(prompt)
-            # Parse JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                self.visual_anchors = json.loads(json_match.group())
-            else:
-                logger.warning("⚠️ Could not parse Gemini response as JSON")
-                self.visual_anchors = {}
-        except Exception as e:
-            logger.warning(f"⚠️ Gemini visual anchor generation failed: {e}")
-            self.visual_anchors = {}
 
-        # Merge phases back into timeline
-        for cid, anchor_data in self.visual_anchors.items():
-            if cid in self.timeline:
-                self.timeline[cid]["phases"] = anchor_data.get("phases", [])
-
-        # Save
-        with open(self.anchors_path, "w", encoding="utf-8") as f:
-            json.dump(self.visual_anchors, f, ensure_ascii=False, indent=2)
-
-        with open(self.timeline_path, "w", encoding="utf-8") as f:
-            json.dump(self.timeline, f, ensure_ascii=False, indent=2)
-
-        logger.info(f"✅ Visual anchors generated for {len(self.visual_anchors)} characters")
-        for cid, data in self.visual_anchors.items():
-            phases = data.get("phases", [])
-            eras = ", ".join(p["era"] for p in phases)
-            logger.info(f"   {cid}: {len(phases)} era(s) — {eras}")
+        # Parse JSON from response
+        json_match = _JSON_BLOCK_RE.search(response)
+        if not json_match:
+            logger.warning(f"⚠️ Could not parse Gemini response for {cid} as JSON")
+            return {}
+        result = json.loads(json_match.group())
 
-        return self.visual_anchors
+        os.makedirs(self.anchor_cache_dir, exist_ok=True)
+        await _awrite_json(cache_path, result)
+        return result
 
     # ------------------------------------------------------------------ #
     #  Step 3: Generate Character Sheets (era-aware)
@@ -339,14 +495,13 @@ Return ONLY the JSON object, no markdown formatting."""
 
         if not self.visual_anchors:
             if os.path.exists(self.anchors_path):
-                with open(self.anchors_path, "r", encoding="utf-8") as f:
-                    self.visual_anchors = json.load(f)
+                self.visual_anchors = await _aread_json(self.anchors_path)
         if not self.timeline:
             if os.path.exists(self.timeline_path):
-                with open(self.timeline_path, "r", encoding="utf-8") as f:
-                    self.timeline = json.load(f)
+                self.timeline = await _aread_json(self.timeline_path)
 
         style_desc = self.style.get("style_anchor", "")
+        style_suffix = f"\n\nVisual Style: {style_desc}" if style_desc else ""
 
         # Build sheet plan: which sheets to generate and where to copy
         sheet_plan = {}  # "CHAR_era" -> { prompt, target_chapters, source_chapter }
@@ -372,27 +527,12 @@ Return ONLY the JSON object, no markdown formatting."""
                     for c in chapters
                 )
 
-                prompt = f"""Create a professional character reference sheet for {cid} ({era} era, age {age}).
-
-Character Description: {visual_anchor}
-
-SHEET LAYOUT:
-Arrange the sheet so that the left side contains two large full-body panels of the character in a relaxed A-pose with accurate anatomy and proportions and a clear silhouette: one full-body front view and one full-body back view, with consistent scale and alignment between them.
-
-On the right side, create four portrait panels arranged in two rows: a front portrait with the face looking straight at the camera, a left-side portrait (profile or three-quarter view facing left), a right-side portrait (profile or three-quarter view facing right), and an extreme close-up face crop that clearly shows fine facial details such as eyes, eyelids or eyelashes, eyebrows, nose, mouth, skin or surface texture, and hair details.
-
-CONSISTENCY RULES:
-- Use a clean, neutral plain background so the character is clear
-- Maintain perfect identity consistency across every panel so the character always looks like the same individual
-- Keep the facial scale consistent across the three standard portraits
-- Use even spacing and clean visual separation between all panels
-- Lighting should remain consistent across the entire sheet (same direction, intensity, and softness)
-- Controlled shadows that preserve detail without dramatic mood shifts
-- Crisp, print-ready reference sheet with sharp details
-- Do NOT change the style from the original description"""
-
-                if style_desc:
-                    prompt += f"\n\nVisual Style: {style_desc}"
+                prompt = _SHEET_PROMPT_TMPL.format_map({
+                    "cid": cid,
+                    "era": era,
+                    "age": age,
+                    "visual_anchor": visual_anchor,
+                }) + style_suffix
 
                 sheet_plan[sheet_key] = {
                     "character": cid,
@@ -405,11 +545,10 @@ CONSISTENCY RULES:
 
         logger.info(f"📋 Sheet plan: {len(sheet_plan)} sheets to generate")
 
-        # Generate sheets
-        generated = 0
+        # Resolve source paths and create directories up front
+        jobs = []  # (sheet_key, plan, sheet_path)
         for sheet_key, plan in sheet_plan.items():
-            source_ch = plan["source_chapter"]
-            cpm = self.proj.get_chapter_pm(source_ch)
+            cpm = self._cpm(plan["source_chapter"])
             if not cpm:
                 continue
 
@@ -417,91 +556,132 @@ CONSISTENCY RULES:
             os.makedirs(sheets_dir, exist_ok=True)
 
             filename = f"{plan['character']}_{plan['era']}_x{plan['freq']}_ref.png"
-            sheet_path = os.path.join(sheets_dir, filename)
+            jobs.append((sheet_key, plan, os.path.join(sheets_dir, filename)))
 
-            # Skip if already exists
-            if os.path.exists(sheet_path) and os.path.getsize(sheet_path) > 1024:
-                logger.info(f"⏭️ {sheet_key}: Already exists")
-            else:
-                logger.info(f"🎨 {sheet_key}: Generating sheet...")
-                try:
+        # Generate sheets concurrently (bounded by the image API rate limit)
+        sem = asyncio.Semaphore(SHEET_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._generate_one_sheet(key, plan, path, sem) for key, plan, path in jobs),
+            return_exceptions=True,
+        )
+        generated = 0
+        for (sheet_key, _, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ {sheet_key}: Sheet job failed: {result}")
+            elif result is True:
+                generated += 1
+
+        # Also generate metadata JSON per chapter (blocking disk I/O)
+        await asyncio.to_thread(self._save_chapter_metadata)
+
+        logger.info(f"✅ Sheets complete: {generated} new sheets generated")
+
+    async def _generate_one_sheet(self, sheet_key: str, plan: dict, sheet_path: str,
+                                  sem: asyncio.Semaphore) -> bool:
+        """
+        Generate one sheet (unless present) and copy it to its target chapters.
+        Returns True if a new sheet was generated.
+        """
+        source_ch = plan["source_chapter"]
+        filename = os.path.basename(sheet_path)
+        generated = False
+
+        # Skip if already exists
+        if _file_size(sheet_path) > 1024:
+            logger.info(f"⏭️ {sheet_key}: Already exists")
+        else:
+            logger.info(f"🎨 {sheet_key}: Generating sheet...")
+            try:
+                async with sem:
                     result = await self.ai.generate_image(
                         prompt=plan["prompt"],
                         output_path=sheet_path,
                     )
-                    if result:
-                        logger.info(f"✅ {sheet_key}: Sheet saved → {sheet_path}")
-                        generated += 1
-                    else:
-                        logger.warning(f"⚠️ {sheet_key}: Generation returned no result")
-                        continue
-                except Exception as e:
-                    logger.warning(f"⚠️ {sheet_key}: Failed: {e}")
-                    continue
-
-            # Copy to target chapters
-            for target_ch in plan["target_chapters"]:
-                if target_ch == source_ch:
-                    continue
-                target_cpm = self.proj.get_chapter_pm(target_ch)
-                if not target_cpm:
-                    continue
-                target_dir = os.path.join(target_cpm.root, "character_sheets")
-                os.makedirs(target_dir, exist_ok=True)
-                target_path = os.path.join(target_dir, filename)
+                if result:
+                    logger.info(f"✅ {sheet_key}: Sheet saved → {sheet_path}")
+                    generated = True
+                else:
+                    logger.warning(f"⚠️ {sheet_key}: Generation returned no result")
+                    return False
+            except Exception as e:
+                logger.warning(f"⚠️ {sheet_key}: Failed: {e}")
+                return False
+
+        # Copy to target chapters (off the event loop, in parallel)
+        copies = {}  # target_ch -> target_path
+        for target_ch in plan["target_chapters"]:
+            if target_ch == source_ch:
+                continue
+            target_cpm = self._cpm(target_ch)
+            if not target_cpm:
+                continue
+            target_dir = os.path.join(target_cpm.root, "character_sheets")
+            os.makedirs(target_dir, exist_ok=True)
+            target_path = os.path.join(target_dir, filename)
 
-                if not os.path.exists(target_path):
-                    shutil.copy2(sheet_path, target_path)
-                    logger.info(f"   📋 Copied to ch{target_ch:02d}")
+            if _file_size(target_path) < 0:
+                copies[target_ch] = target_path
 
-        # Also generate metadata JSON per chapter
-        self._save_chapter_metadata()
+        copy_results = await asyncio.gather(
+            *(asyncio.to_thread(shutil.copy2, sheet_path, tp) for tp in copies.values()),
+            return_exceptions=True,
+        )
+        for target_ch, copy_result in zip(copies, copy_results):
+            if isinstance(copy_result, Exception):
+                logger.warning(f"⚠️ {sheet_key}: Copy to ch{target_ch:02d} failed: {copy_result}")
+            else:
+                logger.info(f"   📋 Copied to ch{target_ch:02d}")
 
-        logger.info(f"✅ Sheets complete: {generated} new sheets generated")
+        return generated
 
     def _save_chapter_metadata(self):
         """Save character_metadata.json for each chapter."""
-        for ch in self.proj.get_all_chapters():
-            idx = ch["index"]
-            if idx == 0:
-                continue
-
-            cpm = self.proj.get_chapter_pm(idx)
-            sheets_dir = os.path.join(cpm.root, "character_sheets")
-            if not os.path.exists(sheets_dir):
+        indices = [ch["index"] for ch in self._all_chapters if ch["index"] != 0]
+        # Resolve path managers up front so workers only read the cache
+        for idx in indices:
+            self._cpm(idx)
+
+        # Chapters are independent; overlap their (small) disk writes
+        with ThreadPoolExecutor(max_workers=METADATA_WRITE_WORKERS) as ex:
+            list(ex.map(self._write_chapter_meta, indices))
+
+    def _write_chapter_meta(self, idx: int):
+        """Write one chapter's character_sheets/character_metadata.json."""
+        cpm = self._cpm(idx)
+        sheets_dir = os.path.join(cpm.root, "character_sheets")
+        if not os.path.exists(sheets_dir):
+            return
+
+        # Collect characters for this chapter
+        metadata = {}
+        for cid, data in self.timeline.items():
+            ch_count = data.get("chapters", {}).get(str(idx), 0)
+            if isinstance(data.get("chapters", {}), dict):
+                ch_count = data["chapters"].get(str(idx),
+                            data["chapters"].get(idx, 0))
+            if ch_count == 0:
                 continue
 
-            # Collect characters for this chapter
-            metadata = {}
-            for cid, data in self.timeline.items():
-                ch_count = data.get("chapters", {}).get(str(idx), 0)
-                if isinstance(data.get("chapters", {}), dict):
-                    ch_count = data["chapters"].get(str(idx),
-                                data["chapters"].get(idx, 0))
-                if ch_count == 0:
-                    continue
-
-                # Find the current era for this chapter
-                current_era = "single"
-                visual_anchor = ""
-                for phase in data.get("phases", []):
-                    if idx in phase.get("chapters", []):
-                        current_era = phase.get("era", "single")
-                        visual_anchor = phase.get("visual_anchor", "")
-                        break
-
-                meta = self.char_db.get_json_metadata(cid.lower()) or {}
-                meta["name"] = cid
-                meta["scene_appearances"] = ch_count
-                meta["era"] = current_era
-                if visual_anchor:
-                    meta["visual_anchor"] = visual_anchor
-                metadata[cid] = meta
-
-            if metadata:
-                meta_path = os.path.join(sheets_dir, "character_metadata.json")
-                with open(meta_path, "w", encoding="utf-8") as f:
-                    json.dump(metadata, f, ensure_ascii=False, indent=2)
+            # Find the current era for this chapter
+            current_era = "single"
+            visual_anchor = ""
+            for phase in data.get("phases", []):
+                if idx in phase.get("chapters", []):
+                    current_era = phase.get("era", "single")
+                    visual_anchor = phase.get("visual_anchor", "")
+                    break
+
+            meta = self.char_db.get_json_metadata(cid.lower()) or {}
+            meta["name"] = cid
+            meta["scene_appearances"] = ch_count
+            meta["era"] = current_era
+            if visual_anchor:
+                meta["visual_anchor"] = visual_anchor
+            metadata[cid] = meta
+
+        if metadata:
+            meta_path = os.path.join(sheets_dir, "character_metadata.json")
+            _write_json(meta_path, metadata)
 
     # ------------------------------------------------------------------ #
     #  Step 4: Inject Visual Anchors into Scene Prompts
@@ -522,28 +702,24 @@ CONSISTENCY RULES:
 
         if not self.visual_anchors:
             if os.path.exists(self.anchors_path):
-                with open(self.anchors_path, "r", encoding="utf-8") as f:
-                    self.visual_anchors = json.load(f)
+                self.visual_anchors = _read_json(self.anchors_path)
 
         if not self.timeline:
             if os.path.exists(self.timeline_path):
-                with open(self.timeline_path, "r", encoding="utf-8") as f:
-                    self.timeline = json.load(f)
+                self.timeline = _read_json(self.timeline_path)
 
         updated_chapters = 0
 
-        for ch in self.proj.get_all_chapters():
+        for ch in self._all_chapters:
             idx = ch["index"]
             if idx == 0:
                 continue
 
-            cpm = self.proj.get_chapter_pm(idx)
-            script_path = os.path.join(cpm.root, "script.json")
-            if not os.path.exists(script_path):
+            script = self._load_script(idx)
+            if script is None:
                 continue
-
-            with open(script_path, "r", encoding="utf-8") as f:
-                script = json.load(f)
+            cpm = self._cpm(idx)
+            script_path = os.path.join(cpm.root, "script.json")
 
             # Build visual anchor lookup for this chapter
             ch_anchors = {}  # char_name -> visual description
@@ -556,45 +732,51 @@ CONSISTENCY RULES:
             if not ch_anchors:
                 continue
 
+            # Find character references in objects that DON'T already have a
+            # parenthetical description ("CharName" not followed by "("), for all
+            # characters in one pass. Longest names first so prefixes lose.
+            names = sorted((n for n, a in ch_anchors.items() if a), key=len, reverse=True)
+            if not names:
+                continue
+            pattern = _anchor_name_pattern(tuple(names))
+            by_lower = {n.lower(): n for n in names}
+            name_set = set(names)
+
             # Update each scene's objects field
             modified = False
             for scene in script.get("scenes", []):
+                # Already injected by an earlier run for all of these names
+                if name_set.issubset(scene.get(INJECTED_SENTINEL, ())):
+                    continue
+
                 objects_text = scene.get("objects", "")
-                for char_name, anchor_text in ch_anchors.items():
-                    if not anchor_text:
-                        continue
-
-                    # Find character references in objects that DON'T already
-                    # have a parenthetical description
-                    # Pattern: "CharName" not followed by "("
-                    pattern = rf'\b{re.escape(char_name)}\b(?!\s*\()'
-                    if re.search(pattern, objects_text, re.IGNORECASE):
-                        # Inject anchor as parenthetical
-                        short_anchor = anchor_text[:120]  # Keep it manageable
-                        replacement = f"{char_name} ({short_anchor})"
-                        objects_text = re.sub(
-                            pattern,
-                            replacement,
-                            objects_text,
-                            count=1,
-                            flags=re.IGNORECASE,
-                        )
-                        modified = True
-
-                scene["objects"] = objects_text
+                injected = set()
+
+                def _inject(m):
+                    # Only the first reference per character gets the anchor
+                    char_name = by_lower[m.group(1).lower()]
+                    if char_name in injected:
+                        return m.group(0)
+                    injected.add(char_name)
+                    short_anchor = ch_anchors[char_name][:120]  # Keep it manageable
+                    return f"{char_name} ({short_anchor})"
+
+                new_text = pattern.sub(_inject, objects_text)
+                if injected:
+                    modified = True
+                    scene[INJECTED_SENTINEL] = sorted(name_set)
+                scene["objects"] = new_text
 
             if modified:
                 # Save updated script
-                with open(script_path, "w", encoding="utf-8") as f:
-                    json.dump(script, f, ensure_ascii=False, indent=2)
+                _write_json(script_path, script)
 
                 # Regenerate prompts
                 scenes = script.get("scenes", [])
                 prompts_txt = format_scene_prompts_txt(scenes)
 
                 sp1 = os.path.join(cpm.root, "scene_prompts.txt")
-                with open(sp1, "w", encoding="utf-8") as f:
-                    f.write(prompts_txt)
+                _write_if_changed(sp1, prompts_txt.encode("utf-8"))
 
                 sp2 = os.path.join(cpm.root, "scene_prompts2.txt")
                 ScriptGenerator._save_single_line_prompts(prompts_txt, sp2)
@@ -651,9 +833,15 @@ async def main():
         help="Only inject visual anchors (assumes timeline + anchors exist)"
     )
 
+    parser.add_argument(
+        "--refresh-anchors", action="store_true",
+        help="Ignore cached Gemini visual anchors and request them again"
+    )
+
     args = parser.parse_args()
 
     manager = CharacterManager(args.project)
+    manager.refresh_anchors = args.refresh_anchors
 
     if args.timeline_only:
         manager.analyze_timeline()
@@ -4,6 +4,9 @@ Main pipeline: Script → TTS → [User provides videos] → Render → Merge 
 """
 
 import asyncio
+import functools
+import hashlib
+import io
 import os
 import sys
 import json
@@ -13,6 +16,7 @@ import logging
 import subprocess
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Optional
@@ -20,7 +24,9 @@ from typing import Optional
 from api.utils.paths import PathManager, ProjectPathManager, ChapterPathManager
 from api.production.project_manager import ProjectManager, slugify
 from api.services.ai import AIClient
-from api.services.tts_service import generate_tts, preprocess_text_for_tts, get_voice_for_language
+from api.services.tts_service import (
+    generate_tts, preprocess_text_for_tts, get_voice_for_language, create_ass_from_vtt
+)
 from api.production.script_generator import ScriptGenerator
 from api.production.character_db import CharacterDB
 from api.production.validators import (
@@ -29,6 +35,16 @@ from api.production.validators import (
 )
 from config.settings import get_style_preset, STYLE_PRESETS
 
+try:
+    import orjson  # Optional C JSON codec; stdlib json is used without it
+except ImportError:
+    orjson = None
+
+try:
+    import av  # Optional PyAV: QA keyframes decoded in-process instead of via ffmpeg + temp JPEGs
+except ImportError:
+    av = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s"
@@ -36,12 +52,23 @@ logging.basicConfig(
 logger = logging.getLogger("BibleOrchestrator")
 
 
+_DURATION_M_RE = re.compile(r'(\d+)\s*m')
+_DURATION_S_RE = re.compile(r'(\d+)\s*s')
+
+# Scene video file names: already-normalized form, then patterns that carry a scene number
+_CORRECT_NAME_RE = re.compile(r'^scene_(\d{3})\.(mp4|mov|avi|mkv|webm)$', re.IGNORECASE)
+_SCENE_PATTERNS = [
+    re.compile(r'(?i)P\d+[_\s-]*scene[_\s-]*(\d+)'),  # P01_scene_1_1080p, P02_scene_2
+    re.compile(r'(?i)scene[_\s-]*(\d+)'),   # Scene_1, scene 1, scene-1, Scene_01
+    re.compile(r'^(\d{1,3})(?:\D|$)'),       # 1.mp4, 01.mp4
+]
+
+
 def _parse_duration_target(duration_str: str) -> float:
     """Parse duration string like '2m30s', '1m', '90s' to minutes (float)."""
-    import re as _re
     minutes = 0.0
-    m_match = _re.search(r'(\d+)\s*m', duration_str)
-    s_match = _re.search(r'(\d+)\s*s', duration_str)
+    m_match = _DURATION_M_RE.search(duration_str)
+    s_match = _DURATION_S_RE.search(duration_str)
     if m_match:
         minutes += int(m_match.group(1))
     if s_match:
@@ -49,6 +76,122 @@ def _parse_duration_target(duration_str: str) -> float:
     return minutes if minutes > 0 else 2.0  # default 2 min
 
 
+# Max concurrent scene renders (each ffmpeg already uses several cores)
+RENDER_CONCURRENCY = max(1, min((os.cpu_count() or 2) // 2, 4))
+# Encoder threads per render so parallel jobs share the cores instead of oversubscribing
+RENDER_THREADS = max(1, (os.cpu_count() or 2) // RENDER_CONCURRENCY)
+
+# Max in-flight image requests during character sheet generation
+SHEET_CONCURRENCY = 4
+
+# Max in-flight TTS requests (override with TTS_CONCURRENCY=N)
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "6"))
+
+# Max concurrent ffprobe processes when probing media durations in bulk
+PROBE_CONCURRENCY = 16
+
+# H.264 encoder for scene renders: "auto" uses a GPU encoder when one works on
+# this machine, otherwise libx264. Set VIDEO_ENCODER=libx264 to force software.
+VIDEO_ENCODER = os.getenv("VIDEO_ENCODER", "auto")
+
+# Max concurrent NVENC encode sessions (GeForce drivers cap these; raise on pro GPUs)
+NVENC_MAX_SESSIONS = int(os.getenv("NVENC_MAX_SESSIONS", "3"))
+
+# Audio encoding for every rendered clip. Keeping all clips at one format lets
+# merge_clips stream-copy them without re-normalizing audio.
+CLIP_AUDIO_ARGS = ("-c:a", "aac", "-b:a", "192k", "-ar", "48000", "-ac", "2")
+CLIP_AUDIO_FORMAT = ("aac", "48000", 2)  # (codec_name, sample_rate, channels) as ffprobe reports
+
+# Video stream fields that must match across clips for a stream-copy concat
+CLIP_VIDEO_PARAMS = ("codec_name", "profile", "level", "width", "height", "pix_fmt",
+                     "time_base", "r_frame_rate", "has_b_frames", "refs")
+
+# Max concurrent ffmpeg keyframe extraction processes during --validate-quality
+KEYFRAME_CONCURRENCY = os.cpu_count() or 4
+
+# Scenes per ffmpeg process when extracting QA keyframes (one decoder per input)
+KEYFRAME_BATCH = 8
+
+# Max in-flight Gemini keyframe analyses during --validate-quality
+QA_AI_CONCURRENCY = 6
+
+# Max in-flight AI calls when generating project-wide YouTube metadata
+METADATA_CONCURRENCY = 4
+
+# Seconds at the end of Shorts / Intro videos covered by the Veo CTA overlay
+CTA_DURATION = 5.0
+
+# Burned-in subtitle style (ASS style overrides, baked into the converted .ass)
+SUBTITLE_STYLE = (
+    "Fontname=Arial,FontSize=14,"
+    "PrimaryColour=&H80FFFFFF,OutlineColour=&H80000000,"
+    "BorderStyle=1,Outline=1,Shadow=0,"
+    "Alignment=2,MarginV=20"
+)
+
+_VIDEO_CODEC_ARGS = {
+    "libx264": ["-c:v", "libx264", "-preset", "fast", "-crf", "18"],
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p5", "-tune", "hq",
+                   "-rc", "vbr", "-cq", "20", "-b:v", "0"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "65"],
+}
+
+
+def _encoder_works(encoder: str) -> bool:
+    """Trial-encode one frame (an encoder can be compiled in without a usable GPU)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-nostdin",
+             "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+             "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, timeout=15,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _video_codec_args() -> tuple:
+    """ffmpeg video codec arguments for scene renders (probed once per process)."""
+    encoder = VIDEO_ENCODER
+    if encoder == "auto":
+        encoder = next(
+            (e for e in ("h264_nvenc", "h264_videotoolbox") if _encoder_works(e)),
+            "libx264",
+        )
+    logger.info(f"🎞️ Video encoder: {encoder}")
+    return tuple(_VIDEO_CODEC_ARGS.get(encoder, ["-c:v", encoder]))
+
+
+def _render_concurrency() -> int:
+    """Parallel scene renders allowed for the selected encoder."""
+    if "h264_nvenc" in _video_codec_args():
+        return max(1, min(RENDER_CONCURRENCY, NVENC_MAX_SESSIONS))
+    return RENDER_CONCURRENCY
+
+
+def _dumps_json(data) -> bytes:
+    """Serialize data as pretty-printed UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path: str, data):
+    """Write data to path as pretty-printed JSON (async callers run this via asyncio.to_thread)."""
+    with open(path, "wb") as f:
+        f.write(_dumps_json(data))
+
+
 def run_cmd(cmd):
     """Execute shell command."""
     try:
@@ -66,6 +209,214 @@ def run_cmd(cmd):
         return False
 
 
+def _exists_and_larger(path: str, min_size: int) -> bool:
+    """True if path exists and is larger than min_size bytes (single stat call)."""
+    try:
+        return os.stat(path).st_size > min_size
+    except OSError:
+        return False
+
+
+def _file_sha256(path: str) -> str:
+    """sha256 hex digest of a file's contents, read in 1 MiB chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _link_or_copy(src: str, dst: str):
+    """
+    Place src's bytes at dst as cheaply as possible: hardlink, then a CoW
+    reflink (Linux cp), then a real copy. Replaces dst if it exists.
+    """
+    try:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    if sys.platform.startswith("linux"):
+        try:
+            result = subprocess.run(
+                ["cp", "--reflink=auto", "--preserve=timestamps", src, dst],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            if result.returncode == 0:
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+async def run_cmd_async(cmd: list) -> bool:
+    """
+    Execute a command (argv list) without blocking the event loop.
+    stdout is discarded; stderr is kept (1 MB read buffer) for the failure log.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.DEVNULL,
+        limit=1 << 20,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        logger.error(f"Command failed: {' '.join(cmd)}\nStderr: {stderr.decode(errors='replace')}")
+        return False
+    return True
+
+
+async def probe_duration_async(path: str) -> float:
+    """Async counterpart of validators.get_duration (0.0 if unreadable)."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            stdin=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return 0.0
+        return float(stdout.decode().strip())
+    except Exception:
+        return 0.0
+
+
+async def extract_keyframe_async(video_path: str, image_path: str) -> bool:
+    """Write the middle frame of a video to image_path (JPEG). True if it exists afterwards."""
+    mid_time = (await probe_duration_async(video_path) or 4.0) / 2.0
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-y", "-nostdin", "-ss", str(mid_time),
+        "-i", video_path, "-frames:v", "1", "-q:v", "2", image_path,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+        stdin=asyncio.subprocess.DEVNULL,
+    )
+    await proc.wait()
+    return os.path.exists(image_path)
+
+
+async def extract_keyframes_async(items: list) -> list:
+    """
+    Write the middle frame of each (video_path, image_path) pair with a single
+    ffmpeg process (one input and one output per pair). Returns a success flag
+    per pair; if the batch fails (e.g. one unreadable input), pairs are retried
+    one at a time so the rest still get a keyframe.
+    """
+    durations = await asyncio.gather(*(probe_duration_async(v) for v, _ in items))
+    cmd = ["ffmpeg", "-y", "-nostdin", "-loglevel", "error"]
+    for (video_path, _), dur in zip(items, durations):
+        cmd += ["-ss", str((dur or 4.0) / 2.0), "-i", video_path]
+    for i, (_, image_path) in enumerate(items):
+        cmd += ["-map", f"{i}:v:0", "-frames:v", "1", "-q:v", "2", image_path]
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+        stdin=asyncio.subprocess.DEVNULL,
+    )
+    if await proc.wait() != 0:
+        return [await extract_keyframe_async(v, image_path) for v, image_path in items]
+    return [os.path.exists(image_path) for _, image_path in items]
+
+
+def extract_keyframe_jpeg(video_path: str) -> Optional[bytes]:
+    """
+    Middle frame of a video as JPEG bytes, decoded in-process with PyAV (requires
+    av + Pillow). Blocking; async callers run it via asyncio.to_thread. None on failure.
+    """
+    try:
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            if container.duration:
+                duration = container.duration / av.time_base
+            elif stream.duration:
+                duration = float(stream.duration * stream.time_base)
+            else:
+                duration = 4.0
+            start = float((stream.start_time or 0) * stream.time_base)
+            target = start + duration / 2.0
+
+            # Seek lands on the keyframe before target; decode forward to the frame itself
+            container.seek(int(target / stream.time_base), stream=stream)
+            frame = None
+            for frame in container.decode(stream):
+                if frame.time is not None and frame.time >= target:
+                    break
+            if frame is None:
+                return None
+
+            buf = io.BytesIO()
+            frame.to_image().save(buf, format="JPEG", quality=95)
+            return buf.getvalue()
+    except Exception as e:
+        logger.debug(f"PyAV keyframe extraction failed for {video_path}: {e}")
+        return None
+
+
+def probe_audio_format(path: str) -> Optional[tuple]:
+    """(codec_name, sample_rate, channels) of the first audio stream, or None."""
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=codec_name,sample_rate,channels",
+             "-of", "json", path],
+            capture_output=True, text=True, timeout=10,
+        )
+        stream = json.loads(result.stdout)["streams"][0]
+        return stream.get("codec_name"), stream.get("sample_rate"), stream.get("channels")
+    except Exception:
+        return None
+
+
+def probe_video_params(path: str) -> Optional[tuple]:
+    """CLIP_VIDEO_PARAMS of the first video stream, or None."""
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "stream=" + ",".join(CLIP_VIDEO_PARAMS),
+             "-of", "json", path],
+            capture_output=True, text=True, timeout=10,
+        )
+        stream = json.loads(result.stdout)["streams"][0]
+        return tuple(stream.get(k) for k in CLIP_VIDEO_PARAMS)
+    except Exception:
+        return None
+
+
+async def probe_video_stream_async(path: str) -> dict:
+    """First video stream's codec/size/rate/pix_fmt via ffprobe ({} if unreadable)."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=codec_name,width,height,avg_frame_rate,pix_fmt",
+            "-of", "json", path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            stdin=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {}
+        streams = json.loads(stdout).get("streams") or [{}]
+        return streams[0]
+    except Exception:
+        return {}
+
+
 class BibleOrchestrator:
     """
     Main orchestrator for Bible animation production.
@@ -118,22 +469,36 @@ class BibleOrchestrator:
         self.scenes = []
         self.chapter_context = None  # Set externally for project-mode chapters
         self.shorts_mode = False  # 9:16 shorts rendering mode
+        self.render_sem = None  # Bounds parallel ffmpeg renders; sized for the encoder on first use
+        self._image_sem = asyncio.Semaphore(SHEET_CONCURRENCY)  # Bounds parallel image requests
+        self._durations = {}  # media path -> probed duration (s), filled before rendering
 
         logger.info(f"🎬 BibleOrchestrator initialized. Run ID: {self.run_id}")
         logger.info(f"🎨 Style: {self.style['name']}")
         logger.info(f"📁 Run directory: {self.pm.root}")
 
+    @property
+    def scenes(self) -> list:
+        return self._scenes
+
+    @scenes.setter
+    def scenes(self, scenes: list):
+        """Assigning scenes also rebuilds the id -> scene index (first match wins)."""
+        self._scenes = scenes
+        self._scene_by_id = {s.get("id"): s for s in reversed(scenes)}
+
     def _load_existing_script(self) -> bool:
         """Load script from disk if it exists (for resume)."""
-        if os.path.exists(self.pm.script_file):
-            try:
-                with open(self.pm.script_file, "r", encoding="utf-8") as f:
-                    self.script_data = json.load(f)
-                self.scenes = self.script_data.get("scenes", [])
-                logger.info(f"💾 Loaded existing script: {len(self.scenes)} scenes")
-                return True
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to load script: {e}")
+        try:
+            with open(self.pm.script_file, "rb") as f:
+                self.script_data = _loads_json(f.read())
+            self.scenes = self.script_data.get("scenes", [])
+            logger.info(f"💾 Loaded existing script: {len(self.scenes)} scenes")
+            return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load script: {e}")
         return False
 
     # ---- Phase 1: Script Generation ----
@@ -198,28 +563,29 @@ class BibleOrchestrator:
         # Sort by frequency (most appearances first)
         char_list = sorted(char_freq.keys(), key=lambda c: -char_freq[c])
         logger.info(f"👥 Characters by frequency: {[(c, char_freq[c]) for c in char_list]}")
-        generated = 0
 
         if len(char_list) <= 3:
             # Individual sheets for all
-            for cid in char_list:
-                ok = await self._generate_single_sheet(cid, sheets_dir, freq=char_freq[cid])
-                if ok:
-                    generated += 1
+            tasks = [
+                self._generate_single_sheet(cid, sheets_dir, freq=char_freq[cid])
+                for cid in char_list
+            ]
         else:
             # Top 2 get individual sheets
             top_chars = char_list[:2]
             remaining_chars = char_list[2:]
 
-            for cid in top_chars:
-                ok = await self._generate_single_sheet(cid, sheets_dir, freq=char_freq[cid])
-                if ok:
-                    generated += 1
+            tasks = [
+                self._generate_single_sheet(cid, sheets_dir, freq=char_freq[cid])
+                for cid in top_chars
+            ]
 
             # Remaining all go into one combined group sheet
-            ok = await self._generate_group_sheet(remaining_chars, sheets_dir)
-            if ok:
-                generated += 1
+            tasks.append(self._generate_group_sheet(remaining_chars, sheets_dir))
+
+        # Sheets are independent image requests; _image_sem bounds concurrency
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        generated = sum(1 for r in results if r is True)
 
         # Also save JSON metadata with frequency info
         meta_path = os.path.join(sheets_dir, "character_metadata.json")
@@ -229,8 +595,8 @@ class BibleOrchestrator:
             meta["scene_appearances"] = char_freq[cid]
             meta["frequency_rank"] = rank
             metadata[cid] = meta
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        with open(meta_path, "wb") as f:
+            f.write(_dumps_json(metadata))
         logger.info(f"📋 Character JSON metadata → {meta_path}")
 
         total_sheets = min(len(char_list), 3) if len(char_list) > 3 else len(char_list)
@@ -241,7 +607,7 @@ class BibleOrchestrator:
         suffix = f"_x{freq}" if freq else ""
         sheet_path = os.path.join(sheets_dir, f"{cid}{suffix}_ref_sheet.png")
 
-        if os.path.exists(sheet_path) and os.path.getsize(sheet_path) > 1024:
+        if _exists_and_larger(sheet_path, 1024):
             logger.info(f"⏭️ {cid}: Character sheet already exists")
             return True
 
@@ -257,7 +623,8 @@ class BibleOrchestrator:
         logger.info(f"🎨 {cid}: Generating character reference sheet...")
 
         try:
-            result = await self.ai.generate_image(prompt=prompt, output_path=sheet_path)
+            async with self._image_sem:
+                result = await self.ai.generate_image(prompt=prompt, output_path=sheet_path)
             if result:
                 logger.info(f"✅ {cid}: Sheet saved → {sheet_path}")
                 return True
@@ -275,16 +642,16 @@ class BibleOrchestrator:
             group_name += f"_and_{len(char_ids)-3}_more"
         sheet_path = os.path.join(sheets_dir, f"GROUP_{group_name}_ref_sheet.png")
 
-        if os.path.exists(sheet_path) and os.path.getsize(sheet_path) > 1024:
+        if _exists_and_larger(sheet_path, 1024):
             logger.info(f"⏭️ Group sheet already exists: {sheet_path}")
             return True
 
-        # Build combined descriptions
+        # Build combined descriptions and the name list in one pass
+        chars = self.char_db.characters
+        names = []
         char_descriptions = []
         for cid in char_ids:
-            ch = self.char_db.characters.get(cid)
-            if not ch:
-                ch = self.char_db.find_by_name(cid)
+            ch = chars.get(cid) or self.char_db.find_by_name(cid)
             if ch:
                 name = ch.get("anchor_name", ch.get("name_en", cid))
                 desc = ch.get("stream_description", ch.get("appearance", ""))
@@ -293,14 +660,12 @@ class BibleOrchestrator:
                     f"• {name}: {desc}. Clothing: {clothing}"
                 )
             else:
+                name = cid
                 char_descriptions.append(f"• {cid}: Biblical character")
+            names.append(name)
 
         chars_text = "\n".join(char_descriptions)
-        char_names = ", ".join(
-            self.char_db.characters.get(cid, {}).get("anchor_name",
-                self.char_db.characters.get(cid, {}).get("name_en", cid))
-            for cid in char_ids
-        )
+        char_names = ", ".join(names)
 
         style_desc = self.style.get("style_anchor", "")
         style_line = f"\n\nVisual Style: {style_desc}" if style_desc else ""
@@ -329,7 +694,8 @@ CONSISTENCY RULES:
         logger.info(f"🎨 GROUP: Generating combined sheet for {char_names}...")
 
         try:
-            result = await self.ai.generate_image(prompt=prompt, output_path=sheet_path)
+            async with self._image_sem:
+                result = await self.ai.generate_image(prompt=prompt, output_path=sheet_path)
             if result:
                 logger.info(f"✅ GROUP: Sheet saved → {sheet_path}")
                 return True
@@ -353,40 +719,48 @@ CONSISTENCY RULES:
             raise RuntimeError("No scenes found. Run script generation first.")
 
         total = len(self.scenes)
-        success_count = 0
 
-        for scene in self.scenes:
-            idx = scene["id"]
-            narration = scene.get("narration", "")
-            audio_path = self.pm.get_audio_path(idx)
-            vtt_path = self.pm.get_vtt_path(idx)
-
-            # Skip if already generated
-            if (os.path.exists(audio_path) and os.path.getsize(audio_path) > 1024
-                    and os.path.exists(vtt_path) and os.path.getsize(vtt_path) > 10):
-                logger.info(f"⏭️ Scene {idx}/{total}: TTS already exists")
-                success_count += 1
-                continue
+        # Determine voice from project language (chapter_context is set externally, after __init__)
+        language = (self.chapter_context or {}).get('language', 'en')
+        voice = get_voice_for_language(language)
 
-            clean_text = preprocess_text_for_tts(narration)
-            if not clean_text:
-                logger.warning(f"⚠️ Scene {idx}: Empty narration, skipping TTS")
-                continue
+        # Each scene is an independent TTS request; the semaphore bounds them
+        sem = asyncio.Semaphore(TTS_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._tts_one(scene, sem, total, voice) for scene in self.scenes)
+        )
+        success_count = sum(1 for ok in results if ok)
 
-            logger.info(f"🗣️ Scene {idx}/{total}: Generating TTS...")
+        logger.info(f"✅ TTS Phase Complete: {success_count}/{total} scenes")
 
-            # Determine voice from project language
-            language = getattr(self, 'chapter_context', {}).get('language', 'en')
-            voice = get_voice_for_language(language)
-            success, msg, _ = await generate_tts(clean_text, audio_path, voice=voice)
+    async def _tts_one(self, scene: dict, sem: asyncio.Semaphore, total: int, voice: str) -> bool:
+        """Generate TTS for one scene unless present. Returns True if audio is available."""
+        idx = scene["id"]
+        narration = scene.get("narration", "")
+        audio_path = self.pm.get_audio_path(idx)
+        vtt_path = self.pm.get_vtt_path(idx)
 
-            if success:
-                success_count += 1
-                logger.info(f"✅ Scene {idx}: TTS complete")
-            else:
-                logger.error(f"❌ Scene {idx}: TTS failed - {msg}")
+        # Skip if already generated
+        if _exists_and_larger(audio_path, 1024) and _exists_and_larger(vtt_path, 10):
+            logger.info(f"⏭️ Scene {idx}/{total}: TTS already exists")
+            return True
 
-        logger.info(f"✅ TTS Phase Complete: {success_count}/{total} scenes")
+        clean_text = preprocess_text_for_tts(narration)
+        if not clean_text:
+            logger.warning(f"⚠️ Scene {idx}: Empty narration, skipping TTS")
+            return False
+
+        async with sem:
+            logger.info(f"🗣️ Scene {idx}/{total}: Generating TTS...")
+            success, msg, _ = await generate_tts(clean_text, audio_path, voice=voice)
+
+        if success:
+            # Bake the styled subtitles now so render_scene only has to reference them
+            self._ensure_ass(vtt_path)
+            logger.info(f"✅ Scene {idx}: TTS complete")
+        else:
+            logger.error(f"❌ Scene {idx}: TTS failed - {msg}")
+        return success
 
     # ---- Phase 3: Wait for User ----
 
@@ -445,55 +819,64 @@ CONSISTENCY RULES:
         if not os.path.exists(scenes_dir):
             return
 
-        # Patterns to extract scene number from filename
-        patterns = [
-            r'(?i)P\d+[_\s-]*scene[_\s-]*(\d+)',  # P01_scene_1_1080p, P02_scene_2
-            r'(?i)scene[_\s-]*(\d+)',   # Scene_1, scene 1, scene-1, Scene_01
-            r'^(\d{1,3})(?:\D|$)',       # 1.mp4, 01.mp4
-        ]
-
         video_exts = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
         existing_files = {}  # scene_num -> source file
 
-        for fname in os.listdir(scenes_dir):
-            fpath = os.path.join(scenes_dir, fname)
-            if not os.path.isfile(fpath):
-                continue
-            _, ext = os.path.splitext(fname)
-            if ext.lower() not in video_exts:
-                continue
+        # One directory read; DirEntry carries the file type, so no per-file stat
+        with os.scandir(scenes_dir) as it:
+            entries = [
+                e for e in it
+                if e.is_file()
+                and os.path.splitext(e.name)[1].lower() in video_exts
+            ]
+        names = {e.name for e in entries}
 
-            # Already in correct format?
-            correct_match = re.match(r'^scene_(\d{3})\.(mp4|mov|avi|mkv|webm)$', fname, re.IGNORECASE)
+        # Already in correct format? These always win over pattern matches
+        others = []
+        for e in entries:
+            correct_match = _CORRECT_NAME_RE.match(e.name)
             if correct_match:
-                num = int(correct_match.group(1))
-                existing_files[num] = fpath
-                continue
+                existing_files[int(correct_match.group(1))] = e.path
+            else:
+                others.append(e)
 
-            # Try to extract scene number
-            name_no_ext = os.path.splitext(fname)[0]
-            for pattern in patterns:
-                m = re.search(pattern, name_no_ext)
+        # Try to extract scene number
+        for e in others:
+            name_no_ext = os.path.splitext(e.name)[0]
+            for pattern in _SCENE_PATTERNS:
+                m = pattern.search(name_no_ext)
                 if m:
                     num = int(m.group(1))
                     if num not in existing_files:
-                        existing_files[num] = fpath
+                        existing_files[num] = e.path
                     break
 
         # Copy/rename files to expected format
         renamed_count = 0
         for num, src_path in sorted(existing_files.items()):
             expected_name = f"scene_{num:03d}.mp4"
-            expected_path = os.path.join(scenes_dir, expected_name)
-
-            if src_path == expected_path:
-                continue  # Already correct
+            if expected_name in names:
+                continue  # Already correct / don't overwrite
 
+            expected_path = os.path.join(scenes_dir, expected_name)
             if os.path.exists(expected_path):
-                continue  # Don't overwrite
+                continue  # Don't overwrite (e.g. case-insensitive filesystem)
 
             logger.info(f"📎 Renaming: {os.path.basename(src_path)} → {expected_name}")
-            shutil.copy2(src_path, expected_path)
+            if os.path.splitext(src_path)[1].lower() == ".mp4":
+                # Same container: link/reflink (no byte copy) where the filesystem allows
+                _link_or_copy(src_path, expected_path)
+            else:
+                # Other containers: stream-copy remux into a real MP4 (no re-encode)
+                remux_cmd = [
+                    "ffmpeg", "-y", "-nostdin", "-loglevel", "error",
+                    "-i", src_path,
+                    "-c", "copy", "-movflags", "+faststart",
+                    expected_path
+                ]
+                if not run_cmd(remux_cmd):
+                    logger.warning(f"⚠️ Remux failed, copying as-is: {os.path.basename(src_path)}")
+                    shutil.copy2(src_path, expected_path)
             renamed_count += 1
 
         if renamed_count > 0:
@@ -516,7 +899,7 @@ CONSISTENCY RULES:
 
     # ---- Phase 4: Render ----
 
-    def render_scene(self, scene_id: int) -> bool:
+    async def render_scene(self, scene_id: int) -> bool:
         """Render a single scene: scene video + TTS audio + VTT subtitles.
         If the scene has skip_tts=True (dialogue-heavy), renders video-only
         without TTS audio overlay and without subtitle burn-in.
@@ -529,7 +912,7 @@ CONSISTENCY RULES:
         output_path = self.pm.get_clip_path(scene_id, shorts=shorts) if hasattr(self.pm, 'clips_shorts') else self.pm.get_clip_path(scene_id)
 
         # Skip if already rendered
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 1024 * 1024:
+        if _exists_and_larger(output_path, 1024 * 1024):
             logger.info(f"⏭️ Scene {scene_id}: Already rendered")
             return True
 
@@ -539,83 +922,68 @@ CONSISTENCY RULES:
 
         # Determine audio priority for this scene
         # audio_priority: "tts" (default) | "veo" (use Veo audio) | "mix" (blend both)
-        scene_data = None
-        for s in self.scenes:
-            if s.get("id") == scene_id:
-                scene_data = s
-                break
-
-        audio_priority = "tts"
-        if scene_data:
-            audio_priority = scene_data.get("audio_priority", "tts")
-            # Backward compat: skip_tts=True → audio_priority="veo"
-            if audio_priority == "tts" and scene_data.get("skip_tts", False):
-                audio_priority = "veo"
+        scene_data = self._scene_by_id.get(scene_id)
+        audio_priority = self._audio_priority(scene_data)
+
+        # Subtitles are burned in by the same pass that scales/encodes the
+        # video (appended to the [v] chain), so every clip is encoded once.
+        subtitle_filter = self._subtitle_filter(vtt_path)
+
+        # Encode to a temp file and rename on success, so an interrupted
+        # render never leaves a partial clip that passes the skip check above
+        temp_path = output_path.replace(".mp4", "_temp.mp4")
 
         if audio_priority == "veo":
             # ---- Veo audio: preserve native audio, still burn VTT subtitles ----
             logger.info(
                 f"🎬 Scene {scene_id}: Rendering with VEO AUDIO + VTT subtitles"
             )
-            video_duration = get_duration(video_path)
             fps = 24
             target_w, target_h = (1080, 1920) if self.shorts_mode else (1920, 1080)
 
+            # Nothing to burn in and already in delivery format: remux, don't re-encode
+            if not subtitle_filter and await self._is_delivery_format(video_path, target_w, target_h, fps):
+                cmd = [
+                    "ffmpeg", "-y", "-nostdin", "-loglevel", "error", "-nostats",
+                    "-i", video_path,
+                    "-map", "0:v", "-map", "0:a?",
+                    "-c", "copy", "-movflags", "+faststart",
+                    temp_path
+                ]
+                if await self._run_render(cmd):
+                    os.replace(temp_path, output_path)
+                    logger.info(f"✅ Scene {scene_id}: Stream-copied (already {target_w}x{target_h}@{fps})")
+                    return True
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                logger.warning(f"⚠️ Scene {scene_id}: Stream-copy failed, re-encoding")
+
             filter_complex = (
                 f"[0:v]"
-                f"fps={fps},setpts=N/({fps}*TB),"
                 f"scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
                 f"crop={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,"
-                f"fps={fps},setpts=N/({fps}*TB)[v]"
+                f"fps={fps},setpts=N/({fps}*TB){subtitle_filter}[v]"
             )
 
-            # Step 1: Base render with Veo audio
-            temp_path = output_path.replace(".mp4", "_temp.mp4")
             cmd = [
-                "ffmpeg", "-y", "-nostdin",
+                "ffmpeg", "-y", "-nostdin", "-loglevel", "error", "-nostats",
                 "-i", video_path,
                 "-filter_complex", filter_complex,
                 "-map", "[v]", "-map", "0:a?",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "18",
+                *_video_codec_args(),
+                "-threads", str(RENDER_THREADS),
                 "-r", str(fps), "-fps_mode", "cfr",
-                "-c:a", "aac", "-b:a", "192k",
+                *CLIP_AUDIO_ARGS,
                 "-pix_fmt", "yuv420p",
                 temp_path
             ]
 
-            if not run_cmd(cmd):
-                logger.error(f"❌ Scene {scene_id}: Veo-audio render failed")
-                return False
-
-            # Step 2: Burn in VTT subtitles
-            if os.path.exists(vtt_path) and os.path.getsize(vtt_path) > 10:
-                vtt_abs = (os.path.abspath(vtt_path)
-                           .replace("\\", "\\\\")
-                           .replace(":", "\\:")
-                           .replace("'", "'\\\\\'"))
-                style = (
-                    "Fontname=Arial,FontSize=14,"
-                    "PrimaryColour=&H80FFFFFF,OutlineColour=&H80000000,"
-                    "BorderStyle=1,Outline=1,Shadow=0,"
-                    "Alignment=2,MarginV=20"
-                )
-                cmd_sub = [
-                    "ffmpeg", "-y", "-nostdin",
-                    "-i", temp_path,
-                    "-vf", f"subtitles='{vtt_abs}':force_style='{style}'",
-                    "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-                    "-c:a", "copy",
-                    output_path
-                ]
-                success = run_cmd(cmd_sub)
+            if not await self._run_render(cmd):
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
-                if not success:
-                    logger.error(f"❌ Scene {scene_id}: Veo subtitle burn-in failed")
-                    return False
-            else:
-                if os.path.exists(temp_path):
-                    os.rename(temp_path, output_path)
+                logger.error(f"❌ Scene {scene_id}: Veo-audio render failed")
+                return False
+            os.replace(temp_path, output_path)
 
             logger.info(f"✅ Scene {scene_id}: Rendered (veo audio + subtitles)")
             return True
@@ -633,71 +1001,40 @@ CONSISTENCY RULES:
                     f"🎬 Scene {scene_id}: Rendering MIXED AUDIO "
                     f"(veo 80% + tts 20%)"
                 )
-                video_duration = get_duration(video_path)
-                audio_duration = get_duration(audio_path)
                 fps = 24
                 target_w, target_h = (1080, 1920) if self.shorts_mode else (1920, 1080)
 
                 filter_complex = (
-                    f"[0:v]fps={fps},setpts=N/({fps}*TB),"
+                    f"[0:v]"
                     f"scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
                     f"crop={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,"
-                    f"fps={fps},setpts=N/({fps}*TB)[v];"
+                    f"fps={fps},setpts=N/({fps}*TB){subtitle_filter}[v];"
                     f"[0:a]volume=0.8[veo_a];"
                     f"[1:a]volume=0.2[tts_a];"
                     f"[veo_a][tts_a]amix=inputs=2:duration=longest[a]"
                 )
 
-                temp_path = output_path.replace(".mp4", "_temp.mp4")
                 cmd = [
-                    "ffmpeg", "-y", "-nostdin",
+                    "ffmpeg", "-y", "-nostdin", "-loglevel", "error", "-nostats",
                     "-i", video_path,
                     "-i", audio_path,
                     "-filter_complex", filter_complex,
                     "-map", "[v]", "-map", "[a]",
-                    "-c:v", "libx264", "-preset", "fast", "-crf", "18",
+                    *_video_codec_args(),
+                    "-threads", str(RENDER_THREADS),
                     "-r", str(fps), "-fps_mode", "cfr",
-                    "-c:a", "aac", "-b:a", "192k",
+                    *CLIP_AUDIO_ARGS,
                     "-shortest",
                     "-pix_fmt", "yuv420p",
                     temp_path
                 ]
 
-                if not run_cmd(cmd):
-                    logger.error(f"❌ Scene {scene_id}: Mix render failed")
-                    return False
-
-                # Subtitle burn-in
-                if os.path.exists(vtt_path) and os.path.getsize(vtt_path) > 10:
-                    vtt_abs = (os.path.abspath(vtt_path)
-                               .replace("\\", "\\\\")
-                               .replace(":", "\\:")
-                               .replace("'", "'\\\\\'"))
-                    style = (
-                        "Fontname=Arial,FontSize=14,"
-                        "PrimaryColour=&H80FFFFFF,OutlineColour=&H80000000,"
-                        "BorderStyle=1,Outline=1,Shadow=0,"
-                        "Alignment=2,MarginV=20"
-                    )
-                    cmd_sub = [
-                        "ffmpeg", "-y", "-nostdin",
-                        "-i", temp_path,
-                        "-vf", f"subtitles='{vtt_abs}':force_style='{style}'",
-                        "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-                        "-c:a", "copy",
-                        output_path
-                    ]
-                    success = run_cmd(cmd_sub)
+                if not await self._run_render(cmd):
                     if os.path.exists(temp_path):
                         os.remove(temp_path)
-                    if not success:
-                        logger.error(
-                            f"❌ Scene {scene_id}: Mix subtitle burn-in failed"
-                        )
-                        return False
-                else:
-                    if os.path.exists(temp_path):
-                        os.rename(temp_path, output_path)
+                    logger.error(f"❌ Scene {scene_id}: Mix render failed")
+                    return False
+                os.replace(temp_path, output_path)
 
                 logger.info(f"✅ Scene {scene_id}: Rendered (mixed audio)")
                 return True
@@ -708,8 +1045,8 @@ CONSISTENCY RULES:
             return False
 
         # Get audio duration
-        audio_duration = get_duration(audio_path)
-        video_duration = get_duration(video_path)
+        audio_duration = await self._duration(audio_path)
+        video_duration = await self._duration(video_path)
 
         if audio_duration <= 0:
             logger.error(f"❌ Scene {scene_id}: Invalid audio duration")
@@ -724,91 +1061,139 @@ CONSISTENCY RULES:
         fps = 24
         target_w, target_h = (1080, 1920) if self.shorts_mode else (1920, 1080)
 
-        # Handle speed adjustment if video is shorter than audio
-        audio_filter = ""
-        audio_map = "1:a"
-        duration_to_use = audio_duration
-
-        if video_duration > 0 and video_duration < audio_duration:
-            ratio = audio_duration / video_duration
-            if ratio > 1.05:
-                # Freeze last frame to extend video to match audio duration
-                # (preserves natural narration speed + video quality)
-                logger.info(f"🧊 Extending video with freeze-frame ({video_duration:.1f}s → {audio_duration:.1f}s)")
-
-        # Video filter — apply freeze-frame extension via tpad if needed
+        # If the video is shorter than the narration, freeze the last frame
+        # via tpad to match (preserves natural narration speed + video quality)
         tpad_filter = ""
         if video_duration > 0 and audio_duration > video_duration * 1.05:
+            logger.info(f"🧊 Extending video with freeze-frame ({video_duration:.1f}s → {audio_duration:.1f}s)")
             freeze_duration = audio_duration - video_duration
             tpad_filter = f"tpad=stop_mode=clone:stop_duration={freeze_duration:.2f},"
 
         filter_complex = (
-            f"{audio_filter}[0:v]"
-            f"fps={fps},{tpad_filter}"
+            f"[0:v]"
+            f"{tpad_filter}"
             f"scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
             f"crop={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,"
-            f"fps={fps},setpts=N/({fps}*TB)[v]"
+            f"fps={fps},setpts=N/({fps}*TB){subtitle_filter}[v]"
         )
 
-        temp_path = output_path.replace(".mp4", "_temp.mp4")
-
-        # Base render
+        # Single render: scale/pad + subtitles + TTS audio
         cmd_base = [
-            "ffmpeg", "-y", "-nostdin",
+            "ffmpeg", "-y", "-nostdin", "-loglevel", "error", "-nostats",
             "-i", video_path,
             "-i", audio_path,
             "-filter_complex", filter_complex,
-            "-map", "[v]", "-map", audio_map,
-            "-c:v", "libx264", "-preset", "fast", "-crf", "18",
+            "-map", "[v]", "-map", "1:a",
+            *_video_codec_args(),
+            "-threads", str(RENDER_THREADS),
             "-r", str(fps), "-fps_mode", "cfr",
-            "-c:a", "aac", "-b:a", "192k",
-            "-t", str(duration_to_use),
+            *CLIP_AUDIO_ARGS,
+            "-t", str(audio_duration),
             "-shortest",
             "-pix_fmt", "yuv420p",
             temp_path
         ]
 
-        if not run_cmd(cmd_base):
-            logger.error(f"❌ Scene {scene_id}: Base render failed")
+        if not await self._run_render(cmd_base):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            logger.error(f"❌ Scene {scene_id}: Render failed")
             return False
+        os.replace(temp_path, output_path)
 
-        # Subtitle burn-in
-        if os.path.exists(vtt_path) and os.path.getsize(vtt_path) > 10:
-            vtt_abs = (os.path.abspath(vtt_path)
-                       .replace("\\", "\\\\")
-                       .replace(":", "\\:")
-                       .replace("'", "'\\\\'"))
-
-            style = (
-                "Fontname=Arial,FontSize=14,"
-                "PrimaryColour=&H80FFFFFF,OutlineColour=&H80000000,"
-                "BorderStyle=1,Outline=1,Shadow=0,"
-                "Alignment=2,MarginV=20"
-            )
+        logger.info(f"✅ Scene {scene_id}: Rendered successfully")
+        return True
 
-            cmd_subtitle = [
-                "ffmpeg", "-y", "-nostdin",
-                "-i", temp_path,
-                "-vf", f"subtitles='{vtt_abs}':force_style='{style}'",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-                "-c:a", "copy",
-                output_path
-            ]
+    @staticmethod
+    def _ensure_ass(vtt_path: str) -> Optional[str]:
+        """Return the pre-styled .ass beside a VTT file, converting it unless its
+        "; Source:" header matches the VTT's content and SUBTITLE_STYLE. Keyed on
+        content, not mtime, because VTTs swapped in with copy2/move keep old mtimes.
+        None when there is no VTT or it has no cues.
+        """
+        try:
+            with open(vtt_path, "rb") as f:
+                vtt_bytes = f.read()
+        except OSError:
+            return None
+        if len(vtt_bytes) <= 10:
+            return None
 
-            success = run_cmd(cmd_subtitle)
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        source_key = hashlib.sha256(SUBTITLE_STYLE.encode("utf-8") + b"\0" + vtt_bytes).hexdigest()
+        ass_path = os.path.splitext(vtt_path)[0] + ".ass"
+        try:
+            with open(ass_path, "r", encoding="utf-8") as f:
+                fresh = f"; Source: {source_key}\n" in (f.readline(), f.readline())
+        except (OSError, UnicodeDecodeError):
+            fresh = False
+        if not fresh and not create_ass_from_vtt(vtt_path, ass_path, SUBTITLE_STYLE, source_key):
+            return None
+        return ass_path
 
-            if not success:
-                logger.error(f"❌ Scene {scene_id}: Subtitle burn-in failed")
-                return False
-        else:
-            # No subtitles, just rename
-            if os.path.exists(temp_path):
-                os.rename(temp_path, output_path)
+    @classmethod
+    def _subtitle_filter(cls, vtt_path: str) -> str:
+        """Return the ",ass=..." [v]-chain suffix for a VTT file, or "" if there is none.
+        The style lives in the .ass header, so renders need no force_style overrides.
+        """
+        ass_path = cls._ensure_ass(vtt_path)
+        if not ass_path:
+            return ""  # No cues, nothing to burn in
 
-        logger.info(f"✅ Scene {scene_id}: Rendered successfully")
-        return True
+        # Filter-graph escaping for the path itself (\, : and ' are special there)
+        ass_abs = (os.path.abspath(ass_path)
+                   .replace("\\", "\\\\")
+                   .replace(":", "\\:")
+                   .replace("'", "'\\\\'"))
+        return f",ass='{ass_abs}'"
+
+    @staticmethod
+    def _audio_priority(scene_data: Optional[dict]) -> str:
+        """Resolve a scene's audio_priority: "tts" (default) | "veo" | "mix"."""
+        if not scene_data:
+            return "tts"
+        audio_priority = scene_data.get("audio_priority", "tts")
+        # Backward compat: skip_tts=True → audio_priority="veo"
+        if audio_priority == "tts" and scene_data.get("skip_tts", False):
+            audio_priority = "veo"
+        return audio_priority
+
+    async def _probe_durations_batch(self, paths) -> dict:
+        """Probe every not-yet-cached path concurrently; returns {path: duration}."""
+        sem = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+        async def _probe(path):
+            async with sem:
+                return await probe_duration_async(path)
+
+        todo = [p for p in dict.fromkeys(paths) if p not in self._durations]
+        for path, duration in zip(todo, await asyncio.gather(*map(_probe, todo))):
+            self._durations[path] = duration
+        return {p: self._durations[p] for p in paths}
+
+    async def _duration(self, path: str) -> float:
+        """Cached media duration (probes on a miss)."""
+        if path not in self._durations:
+            self._durations[path] = await probe_duration_async(path)
+        return self._durations[path]
+
+    @staticmethod
+    async def _is_delivery_format(video_path: str, width: int, height: int, fps: int) -> bool:
+        """True if the clip is already H.264 yuv420p at the target size and frame rate."""
+        stream = await probe_video_stream_async(video_path)
+        return (
+            stream.get("codec_name") == "h264"
+            and stream.get("width") == width
+            and stream.get("height") == height
+            and stream.get("avg_frame_rate") == f"{fps}/1"
+            and stream.get("pix_fmt") == "yuv420p"
+        )
+
+    async def _run_render(self, cmd: list) -> bool:
+        """Run one render ffmpeg command, bounded by render_sem."""
+        if self.render_sem is None:
+            self.render_sem = asyncio.Semaphore(_render_concurrency())
+        async with self.render_sem:
+            return await run_cmd_async(cmd)
 
     async def render_all(self):
         """Phase 4: Render all scenes."""
@@ -828,15 +1213,55 @@ CONSISTENCY RULES:
             return False
 
         total = len(self.scenes)
-        success = 0
 
-        for scene in self.scenes:
-            if self.render_scene(scene["id"]):
-                success += 1
+        # Resume: one directory scan decides which clips are already done
+        done = self._already_rendered_ids()
+        todo = [scene for scene in self.scenes if scene["id"] not in done]
+        if done:
+            logger.info(f"⏭️ {total - len(todo)}/{total} clips already rendered")
+
+        # Probe TTS-scene media up front in parallel instead of 2 ffprobes per render
+        shorts = self.shorts_mode
+        media = []
+        for scene in todo:
+            if self._audio_priority(scene) != "tts":
+                continue  # veo/mix renders don't need durations
+            sid = scene["id"]
+            media.append(self.pm.get_scene_video_path(sid, shorts=shorts) if hasattr(self.pm, 'scenes_shorts') else self.pm.get_scene_video_path(sid))
+            media.append(self.pm.get_audio_path(sid))
+        await self._probe_durations_batch([p for p in media if os.path.exists(p)])
+
+        # Scenes are independent; render_sem bounds how many ffmpeg run at once
+        results = await asyncio.gather(
+            *(self.render_scene(scene["id"]) for scene in todo)
+        )
+        success = (total - len(todo)) + sum(1 for ok in results if ok)
 
         logger.info(f"✅ Rendering complete: {success}/{total} clips")
         return success == total
 
+    def _already_rendered_ids(self) -> set:
+        """Scene ids whose clip exists and passes render_scene's >1MB skip check."""
+        shorts = self.shorts_mode
+        clip_names = {}
+        for scene in self.scenes:
+            sid = scene["id"]
+            path = self.pm.get_clip_path(sid, shorts=shorts) if hasattr(self.pm, 'clips_shorts') else self.pm.get_clip_path(sid)
+            clip_names[os.path.basename(path)] = sid
+        if not clip_names:
+            return set()
+
+        try:
+            with os.scandir(os.path.dirname(path)) as it:
+                return {
+                    clip_names[e.name] for e in it
+                    if e.name in clip_names
+                    and e.is_file()
+                    and e.stat().st_size > 1024 * 1024
+                }
+        except OSError:
+            return set()
+
     # ---- Intro Auto-Assembly ----
 
     async def assemble_intro(self, proj):
@@ -862,8 +1287,8 @@ CONSISTENCY RULES:
         manual_map_path = os.path.join(self.pm.root, "intro_manual_map.json")
         manual_map = {}
         if os.path.exists(manual_map_path):
-            with open(manual_map_path, "r", encoding="utf-8") as f:
-                manual_entries = json.load(f)
+            with open(manual_map_path, "rb") as f:
+                manual_entries = _loads_json(f.read())
             for entry in manual_entries:
                 manual_map[entry["intro_scene"]] = entry
             logger.info(f"📋 Manual map loaded: {len(manual_map)} entries from intro_manual_map.json")
@@ -873,6 +1298,7 @@ CONSISTENCY RULES:
         logger.info("📚 Building source scene catalog from ch01-ch11...")
         source_catalog = []
         chapter_pms = {}  # cache path managers by chapter index
+        source_chapters = []  # (chapter, path manager) pairs to scan
         
         for ch in proj.get_all_chapters():
             idx = ch["index"]
@@ -883,29 +1309,15 @@ CONSISTENCY RULES:
             if not ch_pm:
                 continue
             chapter_pms[idx] = ch_pm
-            
-            script_path = ch_pm.script_file
-            if not os.path.exists(script_path):
-                continue
-            
-            with open(script_path, "r", encoding="utf-8") as f:
-                ch_script = json.load(f)
-            
-            for scene in ch_script.get("scenes", []):
-                scene_video = ch_pm.get_scene_video_path(scene["id"])
-                if not os.path.exists(scene_video):
-                    continue
-                
-                source_catalog.append({
-                    "chapter_idx": idx,
-                    "chapter_slug": ch.get("slug", ""),
-                    "chapter_title": ch.get("title", ""),
-                    "scene_id": scene["id"],
-                    "narration": scene.get("narration", ""),
-                    "characters": scene.get("characters", []),
-                    "video_prompt": scene.get("video_prompt", {}),
-                    "path_manager": ch_pm,
-                })
+            source_chapters.append((ch, ch_pm))
+        
+        # Chapter scripts are independent files: read them in parallel threads
+        chapter_sources = await asyncio.gather(*(
+            asyncio.to_thread(self._intro_sources_for_chapter, ch, ch_pm)
+            for ch, ch_pm in source_chapters
+        ))
+        for sources in chapter_sources:
+            source_catalog.extend(sources)
         
         active_chapters = len(set(s['chapter_idx'] for s in source_catalog))
         logger.info(f"   Found {len(source_catalog)} source scenes across {active_chapters} chapters (ch12 excluded)")
@@ -914,6 +1326,7 @@ CONSISTENCY RULES:
         os.makedirs(self.pm.scenes, exist_ok=True)
         mapping = []
         used_sources = set()
+        src_features = None  # Per-source match features, built on first auto-match
         
         for intro_scene in intro_scenes:
             intro_id = intro_scene["id"]
@@ -932,7 +1345,7 @@ CONSISTENCY RULES:
                     src_video = ch_pm.get_scene_video_path(src_sid)
                     if os.path.exists(src_video):
                         dst_video = self.pm.get_scene_video_path(intro_id)
-                        shutil.copy2(src_video, dst_video)
+                        _link_or_copy(src_video, dst_video)
                         used_sources.add((src_ch, src_sid))
                         
                         mapping.append({
@@ -953,19 +1366,31 @@ CONSISTENCY RULES:
                         logger.warning(f"   ⚠️ Manual map scene ch{src_ch:02d} s{src_sid} video not found, falling back to auto")
             
             # Priority 2: Auto-match (fallback)
-            intro_chars = intro_scene.get("characters", [])
-            intro_prompt = intro_scene.get("video_prompt", {})
+            if src_features is None:
+                # SequenceMatcher indexes seq2 once; reused for every intro scene
+                src_features = [
+                    (SequenceMatcher(None, "", src["narration"].lower()), *self._match_features(src))
+                    for src in source_catalog
+                ]
+            intro_lower = intro_narration.lower()
+            intro_char_set, intro_keywords = self._match_features(intro_scene)
             
             best_score = -1
             best_source = None
             
-            for src in source_catalog:
+            for src, (matcher, src_char_set, src_keywords) in zip(source_catalog, src_features):
                 src_key = (src["chapter_idx"], src["scene_id"])
                 reuse_penalty = 0.3 if src_key in used_sources else 0.0
                 
+                # Cheap upper bound first; only run the full diff if it could win
+                matcher.set_seq1(intro_lower)
+                if self._scene_match_score(
+                    matcher.quick_ratio(), intro_char_set, intro_keywords, src_char_set, src_keywords
+                ) - reuse_penalty <= best_score:
+                    continue
+                
                 score = self._scene_match_score(
-                    intro_narration, intro_chars, intro_prompt,
-                    src["narration"], src["characters"], src["video_prompt"]
+                    matcher.ratio(), intro_char_set, intro_keywords, src_char_set, src_keywords
                 ) - reuse_penalty
                 
                 if score > best_score:
@@ -978,7 +1403,7 @@ CONSISTENCY RULES:
                 
                 src_video = best_source["path_manager"].get_scene_video_path(best_source["scene_id"])
                 dst_video = self.pm.get_scene_video_path(intro_id)
-                shutil.copy2(src_video, dst_video)
+                _link_or_copy(src_video, dst_video)
                 
                 mapping.append({
                     "intro_scene": intro_id,
@@ -1000,8 +1425,8 @@ CONSISTENCY RULES:
         
         # Save mapping for reference
         mapping_path = os.path.join(self.pm.root, "intro_assembly_map.json")
-        with open(mapping_path, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2)
+        with open(mapping_path, "wb") as f:
+            f.write(_dumps_json(mapping))
         
         # Summary
         manual_count = sum(1 for m in mapping if m.get("method") == "manual")
@@ -1016,29 +1441,66 @@ CONSISTENCY RULES:
         
         return True
     
+    @staticmethod
+    def _intro_sources_for_chapter(ch: dict, ch_pm) -> list:
+        """Source-catalog entries for one chapter's scenes that have a video."""
+        script_path = ch_pm.script_file
+        if not os.path.exists(script_path):
+            return []
+        
+        with open(script_path, "rb") as f:
+            ch_script = _loads_json(f.read())
+        
+        # One directory listing per chapter instead of a stat per scene
+        try:
+            with os.scandir(ch_pm.scenes) as it:
+                present = {e.name for e in it}
+        except OSError:
+            return []
+        
+        sources = []
+        for scene in ch_script.get("scenes", []):
+            scene_video = ch_pm.get_scene_video_path(scene["id"])
+            if os.path.basename(scene_video) not in present:
+                continue
+            
+            sources.append({
+                "chapter_idx": ch["index"],
+                "chapter_slug": ch.get("slug", ""),
+                "chapter_title": ch.get("title", ""),
+                "scene_id": scene["id"],
+                "narration": scene.get("narration", ""),
+                "characters": scene.get("characters", []),
+                "video_prompt": scene.get("video_prompt", {}),
+                "path_manager": ch_pm,
+            })
+        return sources
+
+    @staticmethod
+    def _match_features(scene: dict) -> tuple:
+        """Precompute a scene's (character set, keyword set) for intro matching."""
+        char_set = {c.lower() for c in scene.get("characters", [])}
+        keywords = _extract_keywords(scene.get("video_prompt", {}), scene.get("narration", ""))
+        return char_set, keywords
+
     @staticmethod
     def _scene_match_score(
-        intro_narr: str, intro_chars: list, intro_prompt: dict,
-        src_narr: str, src_chars: list, src_prompt: dict
+        text_sim: float, intro_char_set: set, intro_keywords: set,
+        src_char_set: set, src_keywords: set
     ) -> float:
         """Score how well a source scene matches an intro scene.
         
         Components:
-        1. Narration text similarity (SequenceMatcher)
+        1. Narration text similarity (SequenceMatcher ratio, passed in)
         2. Character overlap
         3. Keyword overlap from video prompt fields
         """
         score = 0.0
         
         # 1. Narration text similarity (weight: 0.4)
-        intro_lower = intro_narr.lower()
-        src_lower = src_narr.lower()
-        text_sim = SequenceMatcher(None, intro_lower, src_lower).ratio()
         score += text_sim * 0.4
         
         # 2. Character overlap (weight: 0.25)
-        intro_char_set = {c.lower() for c in intro_chars}
-        src_char_set = {c.lower() for c in src_chars}
         if intro_char_set and src_char_set:
             overlap = len(intro_char_set & src_char_set)
             total = len(intro_char_set | src_char_set)
@@ -1049,8 +1511,6 @@ CONSISTENCY RULES:
             score += 0.1
         
         # 3. Keyword overlap from video prompt (weight: 0.35)
-        intro_keywords = _extract_keywords(intro_prompt, intro_narr)
-        src_keywords = _extract_keywords(src_prompt, src_narr)
         if intro_keywords and src_keywords:
             overlap = len(intro_keywords & src_keywords)
             total = len(intro_keywords | src_keywords)
@@ -1069,68 +1529,193 @@ CONSISTENCY RULES:
         render_dir = self.pm.clips_shorts if (shorts and hasattr(self.pm, 'clips_shorts')) else self.pm.rendered
         concat_list = os.path.join(render_dir, "concat_list.txt")
 
-        # Build concat list from existing clips
-        clip_ids = []
-        for scene in self.scenes:
-            clip_path = self.pm.get_clip_path(scene["id"], shorts=shorts) if hasattr(self.pm, 'clips_shorts') else self.pm.get_clip_path(scene["id"])
-            if os.path.exists(clip_path) and os.path.getsize(clip_path) > 1024:
-                clip_ids.append(scene["id"])
+        # Resolve the clip path getter once rather than per scene
+        if hasattr(self.pm, 'clips_shorts'):
+            get_clip = functools.partial(self.pm.get_clip_path, shorts=shorts)
+        else:
+            get_clip = self.pm.get_clip_path
+
+        # Build concat list from existing clips, in scene-id order
+        clip_paths = {}
+        for idx in sorted(scene["id"] for scene in self.scenes):
+            clip_path = get_clip(idx)
+            if _exists_and_larger(clip_path, 1024):
+                clip_paths[idx] = clip_path
 
-        if not clip_ids:
+        if not clip_paths:
             logger.error("❌ No clips to merge!")
             return None
 
-        # Pre-normalize all clips to 48kHz stereo to prevent
-        # concat audio corruption from mixed formats (TTS=24kHz mono, Veo=48kHz stereo)
         norm_dir = os.path.join(render_dir, "_normalized")
         os.makedirs(norm_dir, exist_ok=True)
 
-        logger.info("🔧 Pre-normalizing audio to 48kHz stereo...")
-        for idx in sorted(clip_ids):
-            src = self.pm.get_clip_path(idx, shorts=shorts) if hasattr(self.pm, 'clips_shorts') else self.pm.get_clip_path(idx)
-            dst = os.path.join(norm_dir, f"clip_{idx:03d}.mp4")
-            norm_cmd = [
-                "ffmpeg", "-y", "-nostdin",
-                "-i", src,
-                "-c:v", "copy",
-                "-af", "aresample=48000,aformat=sample_fmts=fltp:channel_layouts=stereo",
-                "-c:a", "aac", "-b:a", "192k",
-                dst
-            ]
+        if self._clips_share_audio_format(list(clip_paths.values())):
+            # Every clip already has the render_scene audio format: concat as-is
+            logger.info("⏭️ Clip audio already 48kHz stereo AAC, skipping normalization")
+            merge_paths = dict(clip_paths)
+        else:
+            # Pre-normalize all clips to 48kHz stereo to prevent
+            # concat audio corruption from mixed formats (TTS=24kHz mono, Veo=48kHz stereo)
+            # One ffmpeg process with an output per clip (video copied, audio
+            # resampled) instead of spawning a process for every clip
+            logger.info("🔧 Pre-normalizing audio to 48kHz stereo...")
+            merge_paths = {idx: f"{norm_dir}/clip_{idx:03d}.mp4" for idx in clip_paths}
+
+            def _norm_output(i: int, dst: str) -> list:
+                return [
+                    "-map", f"{i}:v:0", "-map", f"{i}:a:0?",
+                    "-c:v", "copy",
+                    "-af", "aresample=48000,aformat=sample_fmts=fltp:channel_layouts=stereo",
+                    "-c:a", "aac", "-b:a", "192k",
+                    dst
+                ]
+
+            norm_cmd = ["ffmpeg", "-y", "-nostdin", "-loglevel", "error"]
+            for src in clip_paths.values():
+                norm_cmd += ["-i", src]
+            for i, dst in enumerate(merge_paths.values()):
+                norm_cmd += _norm_output(i, dst)
             if not run_cmd(norm_cmd):
-                logger.error(f"❌ Audio normalization failed for clip {idx}")
-                return None
+                # One bad clip fails the whole batch: redo them one at a time
+                # so the failing scene is named
+                logger.warning("⚠️ Batch audio normalization failed, retrying per clip...")
+                for idx, src in clip_paths.items():
+                    cmd = ["ffmpeg", "-y", "-nostdin", "-loglevel", "error",
+                           "-i", src, *_norm_output(0, merge_paths[idx])]
+                    if not run_cmd(cmd):
+                        logger.error(f"❌ Audio normalization failed for clip {idx}: {src}")
+                        return None
+
+        # Apply Universal Veo CTA (Shorts + Intro ch00). The overlay only covers
+        # the last CTA_DURATION seconds, so burn it into the last clip (one short
+        # encode) rather than re-encoding the whole master after the merge.
+        cta_on_master = False
+        if shorts or (hasattr(self.pm, 'chapter_idx') and self.pm.chapter_idx == 0):
+            last_idx = max(clip_paths)
+            last_clip = f"{norm_dir}/clip_{last_idx:03d}.mp4"
+            if merge_paths[last_idx] != last_clip:
+                # Work on a link in _normalized/ so the rendered clip stays CTA-free
+                _link_or_copy(merge_paths[last_idx], last_clip)
+                merge_paths[last_idx] = last_clip
+            last_duration = get_duration(last_clip)
+            if last_duration >= CTA_DURATION:
+                self._apply_universal_cta(last_clip, is_shorts=shorts, match_clips=True, duration=last_duration)
+            else:
+                cta_on_master = True
+
+        # Stream-copied Veo clips keep Veo's own H.264 parameters, which the concat
+        # demuxer splices without complaint but plays back corrupt: re-encode them
+        copy_ok = self._match_video_params(merge_paths, norm_dir)
 
-        # Write concat list pointing to normalized clips
+        # Write concat list (absolute paths; ' is escaped per concat demuxer quoting)
         norm_concat = os.path.join(norm_dir, "concat_list.txt")
         with open(norm_concat, "w") as f:
-            for idx in sorted(clip_ids):
-                f.write(f"file 'clip_{idx:03d}.mp4'\n")
+            for path in merge_paths.values():
+                quoted = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{quoted}'\n")
 
         output = self.pm.chapter_shorts_video if (shorts and hasattr(self.pm, 'chapter_shorts_video')) else self.pm.final_video
 
-        merge_cmd = (
-            f"ffmpeg -y -f concat -safe 0 -i {norm_concat} "
-            f"-c copy {output}"
-        )
+        merge_cmd = [
+            "ffmpeg", "-y", "-nostdin", "-f", "concat", "-safe", "0", "-i", norm_concat,
+            "-c", "copy", "-movflags", "+faststart", output
+        ]
+
+        merged = copy_ok and run_cmd(merge_cmd)
+        if not merged:
+            # Stream-copy only works when every clip shares codec params;
+            # re-encode through the concat filter as a last resort.
+            logger.warning("⚠️ Stream-copy merge not possible, re-encoding with concat filter...")
+            merged = run_cmd(self._concat_filter_cmd(list(merge_paths.values()), output))
 
-        if run_cmd(merge_cmd):
+        if merged:
             # Clean up normalized temp files
             shutil.rmtree(norm_dir, ignore_errors=True)
             duration = get_duration(output)
             logger.info(f"✅ Master video created: {output} ({duration:.1f}s)")
 
-            # Apply Universal Veo CTA (Shorts + Intro ch00)
-            if shorts or (hasattr(self.pm, 'chapter_idx') and self.pm.chapter_idx == 0):
-                output = self._apply_universal_cta(output, is_shorts=shorts)
+            # Last clip too short to carry the whole CTA: overlay the master
+            if cta_on_master:
+                output = self._apply_universal_cta(output, is_shorts=shorts, duration=duration)
 
             return output
         else:
             logger.error("❌ Merge failed!")
             return None
 
-    def _apply_universal_cta(self, video_path: str, is_shorts: bool = False) -> str:
-        """Apply universal Veo CTA overlay (Green Screen) to video."""
+    @staticmethod
+    def _clips_share_audio_format(paths: list) -> bool:
+        """True if every clip's first audio stream is CLIP_AUDIO_FORMAT (probed in parallel)."""
+        with ThreadPoolExecutor(max_workers=PROBE_CONCURRENCY) as ex:
+            return all(fmt == CLIP_AUDIO_FORMAT for fmt in ex.map(probe_audio_format, paths))
+
+    @staticmethod
+    def _match_video_params(merge_paths: dict, norm_dir: str) -> bool:
+        """
+        Re-encode (into norm_dir, updating merge_paths) every clip whose video
+        parameters differ from the most common set. True if all clips then
+        match, i.e. the concat demuxer can stream-copy them.
+        """
+        with ThreadPoolExecutor(max_workers=PROBE_CONCURRENCY) as ex:
+            params = dict(zip(merge_paths, ex.map(probe_video_params, merge_paths.values())))
+        counts = {}
+        for p in filter(None, params.values()):
+            counts[p] = counts.get(p, 0) + 1
+        if not counts:
+            return False  # Nothing probed; let the concat filter handle it
+        reference = max(counts, key=counts.get)
+        odd = [idx for idx, p in params.items() if p != reference]
+        if not odd:
+            return True
+
+        logger.info(f"🔧 Re-encoding {len(odd)} clip(s) with mismatched video parameters: {odd}")
+        for idx in odd:
+            dst = f"{norm_dir}/clip_{idx:03d}.mp4"
+            temp = dst.replace(".mp4", "_venc.mp4")
+            cmd = [
+                "ffmpeg", "-y", "-nostdin", "-loglevel", "error",
+                "-i", merge_paths[idx],
+                "-map", "0:v:0", "-map", "0:a?",
+                *_video_codec_args(),
+                "-threads", str(RENDER_THREADS),
+                "-r", "24", "-fps_mode", "cfr", "-pix_fmt", "yuv420p",
+                "-c:a", "copy",
+                temp
+            ]
+            if not run_cmd(cmd):
+                logger.warning(f"⚠️ Clip {idx}: Video re-encode failed")
+                if os.path.exists(temp):
+                    os.remove(temp)
+                return False
+            os.replace(temp, dst)
+            merge_paths[idx] = dst
+            params[idx] = probe_video_params(dst)
+        return None not in params.values() and len(set(params.values())) == 1
+
+    @staticmethod
+    def _concat_filter_cmd(paths: list, output: str) -> list:
+        """Build a re-encoding filter_complex concat command (merge fallback)."""
+        cmd = ["ffmpeg", "-y", "-nostdin", "-loglevel", "error"]
+        for p in paths:
+            cmd += ["-i", p]
+        streams = "".join(f"[{i}:v][{i}:a]" for i in range(len(paths)))
+        cmd += [
+            "-filter_complex", f"{streams}concat=n={len(paths)}:v=1:a=1[v][a]",
+            "-map", "[v]", "-map", "[a]",
+            *_video_codec_args(),
+            "-c:a", "aac", "-b:a", "192k",
+            "-movflags", "+faststart",
+            output
+        ]
+        return cmd
+
+    def _apply_universal_cta(self, video_path: str, is_shorts: bool = False, match_clips: bool = False,
+                             duration: Optional[float] = None) -> str:
+        """Apply universal Veo CTA overlay (Green Screen) to video.
+        match_clips encodes with the scene-render settings so the result can be
+        stream-copy concatenated with the other rendered clips. Pass duration
+        when the caller has already probed the video.
+        """
         # Standard Veo CTA asset
         cta_path = os.path.join("data", "assets", "cta", "veo_cta.mp4")
         if not os.path.exists(cta_path):
@@ -1139,9 +1724,10 @@ CONSISTENCY RULES:
 
         logger.info(f"✨ Applying Veo CTA ({'Shorts' if is_shorts else 'Intro'})...")
         try:
-            duration = get_duration(video_path)
+            if duration is None:
+                duration = get_duration(video_path)
             # CTA logic: Overlay at the end (last 5s)
-            start_time = max(0, duration - 5.0)
+            start_time = max(0, duration - CTA_DURATION)
             output_path = video_path.replace(".mp4", "_cta.mp4")
 
             # Shorts (1080w): scale to 860px (~80%)
@@ -1168,8 +1754,10 @@ CONSISTENCY RULES:
                 f"[0:v][cta_final]overlay=(W-w)/2:{y_pos}:enable='between(t,{start_time},{duration})':shortest=1",
                 "-c:a", "copy",
                 "-shortest",
-                output_path
             ]
+            if match_clips:
+                cmd += [*_video_codec_args(), "-r", "24", "-pix_fmt", "yuv420p"]
+            cmd.append(output_path)
             
             if run_cmd(cmd):
                 shutil.move(output_path, video_path)
@@ -1194,13 +1782,18 @@ CONSISTENCY RULES:
             self._load_existing_script()
 
         plan = self.script_data.get("plan", {})
-        metadata = await self.ai.generate_metadata(self.script_data, plan)
-
         metadata_path = os.path.join(self.pm.final, "metadata.json")
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
 
-        logger.info(f"✅ Metadata saved: {metadata_path}")
+        # Only call the AI when the script changed since metadata was last saved
+        key = _metadata_cache_key(self.script_data)
+        metadata = _load_cached_metadata(metadata_path, key)
+        if metadata is not None:
+            logger.info(f"⏭️ Script unchanged, reusing {metadata_path}")
+        else:
+            metadata, is_fallback = await self.ai.generate_metadata(self.script_data, plan)
+            # The offline fallback is not worth keeping once the AI is reachable again
+            await asyncio.to_thread(_save_metadata, metadata_path, metadata, key, not is_fallback)
+            logger.info(f"✅ Metadata saved: {metadata_path}")
 
         # Print metadata summary
         titles = metadata.get("titles", [])
@@ -1239,15 +1832,25 @@ CONSISTENCY RULES:
                 # Check for missing TTS and generate if needed
                 await self.generate_tts_assets()
 
+                # Metadata only needs the script: overlap the AI call with rendering
+                meta_task = asyncio.create_task(self.generate_metadata())
+
                 # Render + Merge
-                render_ok = await self.render_all()
-                if render_ok:
-                    output = self.merge_clips()
-                    if output:
-                        await self.generate_metadata()
-                        elapsed = time.time() - start_time
-                        logger.info(f"✨ Production complete in {elapsed:.0f}s!")
-                        logger.info(f"🎬 Final video: {output}")
+                output = None
+                try:
+                    render_ok = await self.render_all()
+                    if render_ok:
+                        output = self.merge_clips()
+                finally:
+                    if not output:
+                        meta_task.cancel()
+                        # Reap it so a cancellation or an earlier failure is never left unretrieved
+                        await asyncio.gather(meta_task, return_exceptions=True)
+                if output:
+                    await meta_task
+                    elapsed = time.time() - start_time
+                    logger.info(f"✨ Production complete in {elapsed:.0f}s!")
+                    logger.info(f"🎬 Final video: {output}")
 
             else:  # "full"
                 # Phase 1: Script
@@ -1277,6 +1880,31 @@ CONSISTENCY RULES:
 
 # ---- Intro Assembly Helpers ----
 
+# Words ignored by _extract_keywords (function words + generic prompt boilerplate)
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "shall", "can",
+    "to", "of", "in", "for", "on", "with", "at", "by", "from",
+    "and", "or", "but", "not", "no", "nor", "so", "yet",
+    "as", "if", "then", "than", "that", "this", "these", "those",
+    "his", "her", "its", "their", "your", "our", "my",
+    "he", "she", "it", "they", "we", "you", "i",
+    "him", "them", "us", "me", "who", "whom", "which",
+    "what", "where", "when", "how", "why",
+    "all", "each", "every", "both", "few", "more",
+    "other", "some", "such", "only", "own", "same",
+    "up", "out", "off", "over", "under", "into",
+    "about", "between", "through", "during", "before", "after",
+    "pixar", "disney", "3d", "animation", "rendered", "style",
+    "quality", "detailed", "ultra", "4k", "cinematic",
+    "shot", "medium", "close", "wide", "angle", "camera",
+})
+
+# Keyword candidates: maximal [a-z] runs of 3+ letters
+_KEYWORD_RE = re.compile(r'(?<![a-z])[a-z]{3,}(?![a-z])')
+
+
 def _extract_keywords(prompt: dict, narration: str) -> set:
     """Extract meaningful keywords from a video prompt and narration."""
     text_parts = [
@@ -1286,29 +1914,7 @@ def _extract_keywords(prompt: dict, narration: str) -> set:
         prompt.get("atmosphere", ""),
     ]
     full_text = " ".join(text_parts).lower()
-
-    stop_words = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been",
-        "being", "have", "has", "had", "do", "does", "did", "will",
-        "would", "could", "should", "may", "might", "shall", "can",
-        "to", "of", "in", "for", "on", "with", "at", "by", "from",
-        "and", "or", "but", "not", "no", "nor", "so", "yet",
-        "as", "if", "then", "than", "that", "this", "these", "those",
-        "his", "her", "its", "their", "your", "our", "my",
-        "he", "she", "it", "they", "we", "you", "i",
-        "him", "them", "us", "me", "who", "whom", "which",
-        "what", "where", "when", "how", "why",
-        "all", "each", "every", "both", "few", "more",
-        "other", "some", "such", "only", "own", "same",
-        "up", "out", "off", "over", "under", "into",
-        "about", "between", "through", "during", "before", "after",
-        "pixar", "disney", "3d", "animation", "rendered", "style",
-        "quality", "detailed", "ultra", "4k", "cinematic",
-        "shot", "medium", "close", "wide", "angle", "camera",
-    }
-
-    words = re.findall(r'[a-z]+', full_text)
-    return {w for w in words if len(w) > 2 and w not in stop_words}
+    return set(_KEYWORD_RE.findall(full_text)) - _STOP_WORDS
 
 # ---- YouTube Metadata Generator ----
 
@@ -1319,11 +1925,10 @@ async def generate_project_metadata(project_slug: str):
     2. Introduction (ch00): 3 titles, 3 thumbnail prompts, description, hashtags
     3. Per-chapter shorts: title, thumbnail prompt, description, hashtags
     """
-    from api.services.ai import AIClient
     from google.genai import types
 
     proj = ProjectManager(project_slug)
-    ai = AIClient()
+    ai = _ai_client()
     chapters = proj.get_all_chapters()
     project_data = proj.project_data
 
@@ -1334,8 +1939,8 @@ async def generate_project_metadata(project_slug: str):
         script_path = cpm.script_file
         summary = ""
         if os.path.exists(script_path):
-            with open(script_path, "r", encoding="utf-8") as f:
-                script = json.load(f)
+            with open(script_path, "rb") as f:
+                script = _loads_json(f.read())
             narrations = [s.get("narration", "") for s in script.get("scenes", [])]
             summary = " ".join(narrations)[:500]
         chapter_summaries.append({
@@ -1359,7 +1964,7 @@ async def generate_project_metadata(project_slug: str):
     Project: {project_title}
     Scripture: {scripture_ref}
     Total chapters: {len(chapters)}
-    Chapter list: {json.dumps([{{"title": c["title"], "key_events": c.get("key_events","")}} for c in chapters], ensure_ascii=False)}
+    Chapter list: {json.dumps([dict(title=c["title"], key_events=c.get("key_events", "")) for c in chapters], ensure_ascii=False)}
 
     === YouTube SEO Best Practices ===
     TITLE RULES:
@@ -1408,20 +2013,24 @@ async def generate_project_metadata(project_slug: str):
     }}
     """
 
-    project_meta = await _call_ai_for_metadata(ai, project_prompt)
+    # The project / intro / per-chapter calls are independent: start each as a
+    # task as soon as its prompt is built, then collect the results below
+    sem = asyncio.Semaphore(METADATA_CONCURRENCY)
+
+    async def _meta(prompt: str, path: Optional[str]) -> dict:
+        async with sem:
+            return await _cached_ai_metadata(ai, prompt, path)
 
-    # Save project-level metadata
     project_meta_path = os.path.join(proj.pm.final_dir, "metadata.json")
     os.makedirs(proj.pm.final_dir, exist_ok=True)
-    with open(project_meta_path, "w", encoding="utf-8") as f:
-        json.dump(project_meta, f, ensure_ascii=False, indent=2)
-    logger.info(f"✅ Project metadata saved: {project_meta_path}")
+    project_task = asyncio.create_task(_meta(project_prompt, project_meta_path))
 
     # ---- 2. Introduction (ch00) metadata ----
     logger.info("📦 Generating introduction metadata...")
 
     intro_ch = next((c for c in chapters if c["index"] == 0), None)
     intro_meta = {}
+    intro_task = None
     if intro_ch:
         intro_prompt = f"""
         Generate YouTube metadata {lang_instruction} for a Bible animation TRAILER/INTRODUCTION video.
@@ -1448,18 +2057,15 @@ async def generate_project_metadata(project_slug: str):
           "tags": ["keyword1", "keyword2", "..."]
         }}
         """
-        intro_meta = await _call_ai_for_metadata(ai, intro_prompt)
-
         intro_cpm = proj.get_chapter_pm(0)
         intro_meta_path = os.path.join(intro_cpm.root, "metadata.json")
-        with open(intro_meta_path, "w", encoding="utf-8") as f:
-            json.dump(intro_meta, f, ensure_ascii=False, indent=2)
-        logger.info(f"✅ Introduction metadata saved: {intro_meta_path}")
+        intro_task = asyncio.create_task(_meta(intro_prompt, intro_meta_path))
 
     # ---- 3. Per-chapter shorts metadata ----
     logger.info("📦 Generating per-chapter shorts metadata...")
 
     all_shorts_meta = {}
+    shorts_jobs = []  # (ch_info, per-chapter prompt, save path)
     for ch_info in chapter_summaries:
         if ch_info["index"] == 0:
             continue  # intro handled separately
@@ -1488,18 +2094,88 @@ async def generate_project_metadata(project_slug: str):
         }}
         """
 
-        ch_meta = await _call_ai_for_metadata(ai, shorts_prompt)
-        all_shorts_meta[f"ch{ch_info['index']:02d}"] = ch_meta
-
         # Save per-chapter
-        ch_obj = proj.get_chapter(ch_info["index"])
-        if ch_obj:
+        shorts_meta_path = None
+        if proj.get_chapter(ch_info["index"]):
             cpm = proj.get_chapter_pm(ch_info["index"])
             shorts_meta_path = os.path.join(cpm.root, "shorts_metadata.json")
-            with open(shorts_meta_path, "w", encoding="utf-8") as f:
-                json.dump(ch_meta, f, ensure_ascii=False, indent=2)
+        shorts_jobs.append((ch_info, shorts_prompt, shorts_meta_path))
+
+    async def _shorts_metadata(jobs: list) -> list:
+        """
+        Shorts metadata per job: unchanged chapters come from their saved file, the
+        rest are requested together in one prompt. Chapters missing or malformed in
+        the batched reply fall back to their own per-chapter prompt.
+        """
+        results = []
+        for _, prompt, path in jobs:
+            cached = _load_cached_metadata(path, _metadata_cache_key(prompt))
+            if cached is not None:
+                logger.info(f"⏭️ Metadata unchanged, reusing {path}")
+            results.append(cached)
+        todo = [i for i, meta in enumerate(results) if meta is None]
+
+        if len(todo) > 1:
+            batch_chapters = [
+                {
+                    "key": f"ch{jobs[i][0]['index']:02d}",
+                    "chapter": jobs[i][0]["index"],
+                    "title": jobs[i][0]["title"],
+                    "key_events": jobs[i][0]["key_events"],
+                    "script_excerpt": jobs[i][0]["summary_excerpt"],
+                }
+                for i in todo
+            ]
+            batch_prompt = f"""
+            Generate YouTube Shorts metadata {lang_instruction} for 9:16 vertical short videos.
+            Each one is a Shorts version of one chapter from a Bible animation series.
+
+            Series: {project_title}
+            Chapters: {json.dumps(batch_chapters, ensure_ascii=False)}
+
+            Important: Shorts titles must be SHORT (under 40 chars), punchy, and hook-driven.
+
+            Return one JSON object mapping each chapter "key" (e.g. "ch01") to:
+            {{
+              "title": "Short punchy Shorts title (under 40 chars)",
+              "thumbnail_prompt": "Vertical 9:16 thumbnail prompt (dramatic moment, bold, mobile-optimized)",
+              "description": "Short Shorts description (100-200 chars, include series link)",
+              "hashtags": ["#Shorts", "#hashtag1", "#hashtag2", "..."]
+            }}
+            """
+            async with sem:
+                batch = await _call_ai_for_metadata(ai, batch_prompt)
+            if not isinstance(batch, dict):
+                batch = {}
+            for i, entry in zip(todo, batch_chapters):
+                ch_info, prompt, path = jobs[i]
+                meta = batch.get(entry["key"])
+                if _is_shorts_metadata(meta):
+                    results[i] = meta
+                    if path:
+                        # Saved under the per-chapter prompt's key, so reruns hit the cache
+                        await asyncio.to_thread(_save_metadata, path, meta, _metadata_cache_key(prompt))
+
+        fallback = [i for i in todo if results[i] is None]
+        if fallback and len(todo) > 1:
+            logger.warning(f"⚠️ Batched Shorts metadata incomplete, requesting {len(fallback)} chapters individually")
+        metas = await asyncio.gather(*(_meta(jobs[i][1], jobs[i][2]) for i in fallback))
+        for i, meta in zip(fallback, metas):
+            results[i] = meta
+        return results
+
+    shorts_task = asyncio.create_task(_shorts_metadata(shorts_jobs))
+
+    project_meta = await project_task
+    logger.info(f"✅ Project metadata saved: {project_meta_path}")
 
-        logger.info(f"   ✅ Ch{ch_info['index']:02d}: {ch_meta.get('title', ch_title)}")
+    if intro_task:
+        intro_meta = await intro_task
+        logger.info(f"✅ Introduction metadata saved: {intro_meta_path}")
+
+    for (ch_info, _, _), ch_meta in zip(shorts_jobs, await shorts_task):
+        all_shorts_meta[f"ch{ch_info['index']:02d}"] = ch_meta
+        logger.info(f"   ✅ Ch{ch_info['index']:02d}: {ch_meta.get('title', ch_info['title'])}")
 
     # ---- Save combined summary ----
     combined = {
@@ -1508,8 +2184,7 @@ async def generate_project_metadata(project_slug: str):
         "shorts": all_shorts_meta,
     }
     combined_path = os.path.join(proj.pm.root, "youtube_metadata.json")
-    with open(combined_path, "w", encoding="utf-8") as f:
-        json.dump(combined, f, ensure_ascii=False, indent=2)
+    await asyncio.to_thread(_write_json, combined_path, combined)
 
     logger.info(f"\n✅ All YouTube metadata saved!")
     logger.info(f"   Combined: {combined_path}")
@@ -1560,6 +2235,76 @@ async def _call_ai_for_metadata(ai, prompt: str) -> dict:
 
 
 
+def _metadata_cache_key(*inputs) -> str:
+    """Stable hash of everything an AI metadata call depends on."""
+    blob = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _load_cached_metadata(path: Optional[str], key: str) -> Optional[dict]:
+    """Metadata saved at path if it was generated from the same inputs, else None."""
+    if not path:
+        return None
+    try:
+        # The key lives in a "<path>.key" sidecar so the deliverable JSON keeps its schema
+        with open(f"{path}.key", "r", encoding="utf-8") as f:
+            if f.read().strip() != key:
+                return None
+        with open(path, "rb") as f:
+            data = _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _save_metadata(path: str, metadata: dict, key: str, cacheable: bool = True):
+    """Write metadata and its "<path>.key" cache sidecar (failed generations are not cached)."""
+    key_path = f"{path}.key"
+    # Drop the old key first so an interrupted write can never validate stale output
+    try:
+        os.remove(key_path)
+    except FileNotFoundError:
+        pass
+    _write_json(path, metadata)
+    if cacheable and "error" not in metadata:
+        with open(key_path, "w", encoding="utf-8") as f:
+            f.write(key)
+
+
+def _is_shorts_metadata(meta) -> bool:
+    """True if meta has every field of the Shorts metadata schema."""
+    return (
+        isinstance(meta, dict)
+        and all(isinstance(meta.get(k), str) and meta[k] for k in ("title", "thumbnail_prompt", "description"))
+        and isinstance(meta.get("hashtags"), list)
+    )
+
+
+async def _cached_ai_metadata(ai, prompt: str, path: Optional[str]) -> dict:
+    """_call_ai_for_metadata, skipped when path already holds output for this prompt."""
+    key = _metadata_cache_key(prompt)
+    cached = _load_cached_metadata(path, key)
+    if cached is not None:
+        logger.info(f"⏭️ Metadata unchanged, reusing {path}")
+        return cached
+    metadata = await _call_ai_for_metadata(ai, prompt)
+    if path:
+        await asyncio.to_thread(_save_metadata, path, metadata, key)
+    return metadata
+
+
+@functools.lru_cache(maxsize=1)
+def _ai_client() -> AIClient:
+    """AIClient shared by the CLI commands in this process (created on first use)."""
+    return AIClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _character_db() -> CharacterDB:
+    """CharacterDB shared by the CLI commands in this process (loaded on first use)."""
+    return CharacterDB()
+
+
 async def main():
     import argparse
 
@@ -1611,6 +2356,8 @@ async def main():
                         help="Auto-assemble ch00 intro from existing chapter scene videos")
     parser.add_argument("--validate-quality", action="store_true",
                         help="AI-powered visual quality analysis of all scene videos (uses Gemini 3 Flash)")
+    parser.add_argument("--force-revalidate", action="store_true",
+                        help="With --validate-quality: ignore cached results and re-analyze every scene")
     parser.add_argument("--generate-thumbnails", action="store_true",
                         help="Generate 3 A/B test thumbnails + titles for project, intro, and shorts")
     parser.add_argument("--render-curation-shorts", action="store_true",
@@ -1620,7 +2367,7 @@ async def main():
 
     # --- Character sheet prompt ---
     if args.char_sheet:
-        char_db = CharacterDB()
+        char_db = _character_db()
         prompt = char_db.get_character_sheet_prompt(args.char_sheet)
         print("\n" + "=" * 60)
         print(f"360° CHARACTER SHEET PROMPT — {args.char_sheet}")
@@ -1632,7 +2379,7 @@ async def main():
     # --- Character JSON metadata ---
     if args.char_json:
         import json as _json
-        char_db = CharacterDB()
+        char_db = _character_db()
         meta = char_db.get_json_metadata(args.char_json)
         print("\n" + "=" * 60)
         print(f"CHARACTER JSON METADATA — {args.char_json}")
@@ -1652,10 +2399,10 @@ async def main():
             logger.error(f"❌ No script.json found for run {run_id}")
             return
 
-        with open(pm.script_file, "r", encoding="utf-8") as f:
-            script_data = json.load(f)
+        with open(pm.script_file, "rb") as f:
+            script_data = _loads_json(f.read())
 
-        char_db = CharacterDB()
+        char_db = _character_db()
         script_gen = ScriptGenerator(
             character_db=char_db,
             style_preset=args.style,
@@ -1695,7 +2442,7 @@ async def main():
 
         # Use AI to plan chapters
         logger.info("🤖 Planning chapters with AI...")
-        ai = AIClient()
+        ai = _ai_client()
         chapter_plan = await ai.plan_chapters(
             title=args.new_project,
             scripture_ref=args.scripture,
@@ -1769,8 +2516,8 @@ async def main():
             if not os.path.exists(prompts_path):
                 issues.append(f"ch{idx:02d}: scene_prompts.txt MISSING")
 
-            with open(script_path, "r", encoding="utf-8") as f:
-                script = json.load(f)
+            with open(script_path, "rb") as f:
+                script = _loads_json(f.read())
             scenes = script.get("scenes", [])
             num_scenes = len(scenes)
             total_scenes += num_scenes
@@ -1782,6 +2529,13 @@ async def main():
             missing_vtt = 0
             zero_mp3 = 0
 
+            # One listing of the assets dir instead of exists() checks per scene
+            try:
+                with os.scandir(cpm.assets) as it:
+                    asset_names = {e.name for e in it}
+            except OSError:
+                asset_names = set()
+
             for scene in scenes:
                 sid = scene.get("id", 0)
                 dur = scene.get("duration", 0)
@@ -1793,12 +2547,12 @@ async def main():
                 # MP3/VTT existence
                 mp3 = cpm.get_audio_path(sid)
                 vtt = cpm.get_vtt_path(sid)
-                if not os.path.exists(mp3):
+                if os.path.basename(mp3) not in asset_names:
                     missing_mp3 += 1
                 elif os.path.getsize(mp3) == 0:
                     zero_mp3 += 1
                     issues.append(f"ch{idx:02d} scene {sid}: audio_*.mp3 is 0 bytes")
-                if not os.path.exists(vtt):
+                if os.path.basename(vtt) not in asset_names:
                     missing_vtt += 1
 
             total_duration += ch_duration
@@ -1853,7 +2607,7 @@ async def main():
     # --- Project: Thumbnail A/B Test Generation ---
     if args.project and args.generate_thumbnails:
         proj = ProjectManager(args.project)
-        ai = AIClient()
+        ai = _ai_client()
         if not ai.client:
             logger.error("❌ AI client not available. Cannot generate thumbnails.")
             return
@@ -1952,8 +2706,8 @@ async def main():
 
             # Save concepts.json
             concepts_path = os.path.join(output_dir, "concepts.json")
-            with open(concepts_path, "w", encoding="utf-8") as f:
-                json.dump(concepts, f, indent=2, ensure_ascii=False)
+            with open(concepts_path, "wb") as f:
+                f.write(_dumps_json(concepts))
             logger.info(f"   📄 Concepts saved: {concepts_path}")
 
         logger.info(f"\n✅ Thumbnail generation complete!")
@@ -1962,7 +2716,6 @@ async def main():
 
     # --- Project: Visual Quality Analysis ---
     if args.project and args.validate_quality:
-        import subprocess as _sp
         proj = ProjectManager(args.project)
 
         # Add file logging so user can: tail -f <log_path>
@@ -1974,175 +2727,238 @@ async def main():
         logger.info(f"🔬 ═══ Visual Quality Analysis: {proj.project_data.get('title', '')} ═══")
         logger.info(f"📝 로그 파일: {qa_log_path}")
         logger.info(f"💡 터미널에서 실시간 확인: tail -f {qa_log_path}")
-        ai = AIClient()
+        ai = _ai_client()
         if not ai.client:
             logger.error("❌ AI client not available. Cannot perform visual QA.")
             return
 
-        qa_results = []
         total_pass = 0
         total_warn = 0
         total_fail = 0
 
         chapters = proj.get_all_chapters()
 
-        # Pre-scan: count total scenes for progress tracking
-        total_scene_count = 0
+        # Pre-scan: list each chapter's scene_XXX.mp4 files once (None if there is
+        # no scenes directory) and count them for progress tracking
+        chapter_scene_files = {}
         for ch in chapters:
             sd = os.path.join(proj.get_chapter_pm(ch["index"]).root, "scenes")
-            if os.path.isdir(sd):
-                total_scene_count += len([f for f in os.listdir(sd) if f.startswith("scene_") and f.endswith(".mp4")])
+            try:
+                with os.scandir(sd) as it:
+                    chapter_scene_files[ch["index"]] = sorted(
+                        e.name for e in it
+                        if e.name.startswith("scene_") and e.name.endswith(".mp4")
+                    )
+            except OSError:
+                chapter_scene_files[ch["index"]] = None
+        total_scene_count = sum(len(files) for files in chapter_scene_files.values() if files)
         logger.info(f"📊 Total scenes to analyze: {total_scene_count}")
         analyzed_count = 0
 
+        keyframe_sem = asyncio.Semaphore(KEYFRAME_CONCURRENCY)
+        ai_sem = asyncio.Semaphore(QA_AI_CONCURRENCY)
+
+        async def _extract_batch(batch: list) -> list:
+            async with keyframe_sem:
+                return await extract_keyframes_async(batch)
+
+        async def _qa_scene(batch_task: Optional[asyncio.Task], pos: int, scene_path: str,
+                            keyframe_path: str, context: str, vprompt: str,
+                            cache_path: str) -> Optional[dict]:
+            """Get the scene's keyframe, then analyze it (None if no keyframe)."""
+            if batch_task is None:
+                # PyAV: decode the frame in-process and hand the JPEG bytes straight over
+                async with keyframe_sem:
+                    image_bytes = await asyncio.to_thread(extract_keyframe_jpeg, scene_path)
+                if image_bytes is None:
+                    return None
+                async with ai_sem:
+                    result = await ai.analyze_scene_quality(
+                        scene_path, context, vprompt, image_bytes=image_bytes)
+            else:
+                if not (await batch_task)[pos]:
+                    return None
+                try:
+                    # Analyze with AI (narration + video prompt for Bible-aware context)
+                    async with ai_sem:
+                        result = await ai.analyze_scene_quality(keyframe_path, context, vprompt)
+                finally:
+                    os.remove(keyframe_path)
+            # analyze_scene_quality's failure fallbacks carry no recommendation; don't cache those
+            if "recommendation" in result:
+                await asyncio.to_thread(_write_json, cache_path, result)
+            return result
+
+        # Content-addressed result cache: an unchanged scene file analyzed with the
+        # same narration, video prompt and model is not sent to Gemini again
+        qa_cache_dir = os.path.join(proj.pm.root, ".qa_cache")
+        os.makedirs(qa_cache_dir, exist_ok=True)
+        cached_count = 0
+
+        # Start every scene's extract → analyze task up front so ffmpeg work overlaps
+        # the Gemini round-trips; results are consumed below in chapter/scene order
+        chapter_jobs = []
         for ch in chapters:
             idx = ch["index"]
             cpm = proj.get_chapter_pm(idx)
             scenes_dir = os.path.join(cpm.root, "scenes")
+            scene_files = chapter_scene_files[idx]
 
-            if not os.path.isdir(scenes_dir):
-                logger.info(f"   ⏭️ ch{idx:02d}: No scenes directory")
+            if scene_files is None:
+                chapter_jobs.append((ch, f"   ⏭️ ch{idx:02d}: No scenes directory", []))
                 continue
 
-            # Find scene_XXX.mp4 files
-            scene_files = sorted([
-                f for f in os.listdir(scenes_dir)
-                if f.startswith("scene_") and f.endswith(".mp4")
-            ])
-
             if not scene_files:
-                logger.info(f"   ⏭️ ch{idx:02d}: No scene videos")
+                chapter_jobs.append((ch, f"   ⏭️ ch{idx:02d}: No scene videos", []))
                 continue
 
-            logger.info(f"\n📂 ch{idx:02d} ({ch.get('title', '')}): {len(scene_files)} scenes")
-
             # Load script for scene context (narration + video prompt)
             script_path = os.path.join(cpm.root, "script.json")
             scene_contexts = {}
             scene_prompts = {}
             if os.path.exists(script_path):
-                with open(script_path, "r", encoding="utf-8") as f:
-                    script = json.load(f)
+                with open(script_path, "rb") as f:
+                    script = _loads_json(f.read())
                 for s in script.get("scenes", []):
                     sid = s.get("id", 0)
                     scene_contexts[sid] = s.get("narration", "")[:200]
                     scene_prompts[sid] = s.get("video_prompt", "")[:200]
 
-            for si, scene_file in enumerate(scene_files, 1):
-                analyzed_count += 1
-                scene_path = os.path.join(scenes_dir, scene_file)
+            file_hashes = await asyncio.gather(*(
+                asyncio.to_thread(_file_sha256, os.path.join(scenes_dir, scene_file))
+                for scene_file in scene_files
+            ))
 
+            jobs = []
+            pending = []  # (job index, scene path, keyframe path, context, prompt, cache path)
+            for scene_file, file_hash in zip(scene_files, file_hashes):
                 # Extract scene ID from filename
                 try:
                     sid = int(scene_file.replace("scene_", "").replace(".mp4", ""))
                 except ValueError:
                     sid = 0
 
-                # Extract middle keyframe
-                keyframe_path = os.path.join(scenes_dir, f".qa_{scene_file.replace('.mp4', '.jpg')}")
-
-                # Get duration, extract middle frame
-                dur_result = _sp.run(
-                    ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                     "-of", "default=noprint_wrappers=1:nokey=1", scene_path],
-                    stdout=_sp.PIPE, stderr=_sp.STDOUT
-                )
-                try:
-                    dur = float(dur_result.stdout)
-                except (ValueError, TypeError):
-                    dur = 4.0
-
-                mid_time = dur / 2.0
-                _sp.run(
-                    ["ffmpeg", "-y", "-nostdin", "-ss", str(mid_time),
-                     "-i", scene_path, "-frames:v", "1", "-q:v", "2", keyframe_path],
-                    stdout=_sp.DEVNULL, stderr=_sp.DEVNULL
-                )
-
-                if not os.path.exists(keyframe_path):
-                    logger.warning(f"   ⚠️ {scene_file}: Could not extract keyframe")
-                    continue
-
-                # Analyze with AI (narration + video prompt for Bible-aware context)
                 context = scene_contexts.get(sid, "")
                 vprompt = scene_prompts.get(sid, "")
-                result = await ai.analyze_scene_quality(keyframe_path, context, vprompt)
-
-                status = result.get("status", "WARN")
-                score = result.get("score", 5)
-                issues = result.get("issues", [])
-                recommendation = result.get("recommendation", "")
-
-                icon = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌"}.get(status, "❓")
-                pct = analyzed_count / total_scene_count * 100 if total_scene_count else 0
-                logger.info(f"   {icon} [{analyzed_count}/{total_scene_count} ({pct:.0f}%)] {scene_file}: {status} (Score: {score}/10)")
-                if issues:
-                    for issue in issues:
-                        logger.info(f"      → {issue}")
-
-                if status == "PASS":
-                    total_pass += 1
-                elif status == "WARN":
-                    total_warn += 1
-                else:
-                    total_fail += 1
-
-                qa_results.append({
-                    "chapter": idx,
-                    "chapter_title": ch.get("title", ""),
-                    "scene": scene_file,
-                    "scene_id": sid,
-                    "status": status,
-                    "score": score,
-                    "issues": issues,
-                    "recommendation": recommendation,
-                })
-
-                # Remove temp keyframe
-                os.remove(keyframe_path)
+                cache_key = _metadata_cache_key(file_hash, context, vprompt, ai.model_name)
+                cache_path = os.path.join(qa_cache_dir, f"{cache_key}.json")
+                cached = None
+                if not args.force_revalidate:
+                    try:
+                        with open(cache_path, "rb") as f:
+                            cached = _loads_json(f.read())
+                    except (OSError, ValueError):
+                        pass  # Not cached yet (or unreadable): analyze again
+                if cached is not None:
+                    jobs.append((scene_file, sid, cached))
+                    cached_count += 1
+                    continue
 
-        # Generate qa_report.md
+                keyframe_path = os.path.join(scenes_dir, f".qa_{scene_file.replace('.mp4', '.jpg')}")
+                pending.append((len(jobs), os.path.join(scenes_dir, scene_file), keyframe_path,
+                                context, vprompt, cache_path))
+                jobs.append((scene_file, sid, None))
+
+            # Without PyAV, keyframes are extracted KEYFRAME_BATCH scenes per ffmpeg process
+            for i in range(0, len(pending), KEYFRAME_BATCH):
+                batch = pending[i:i + KEYFRAME_BATCH]
+                batch_task = None
+                if av is None:
+                    batch_task = asyncio.create_task(_extract_batch([(p[1], p[2]) for p in batch]))
+                for pos, (n, scene_path, keyframe_path, context, vprompt, cache_path) in enumerate(batch):
+                    task = asyncio.create_task(_qa_scene(
+                        batch_task, pos, scene_path, keyframe_path, context, vprompt, cache_path))
+                    jobs[n] = (jobs[n][0], jobs[n][1], task)
+
+            header = f"\n📂 ch{idx:02d} ({ch.get('title', '')}): {len(scene_files)} scenes"
+            chapter_jobs.append((ch, header, jobs))
+
+        if cached_count:
+            logger.info(f"♻️ Reusing cached analysis for {cached_count} unchanged scenes (--force-revalidate to redo)")
+
+        # qa_report.md is written as results arrive (tail -f friendly); only FAIL/WARN
+        # results are kept for the detail sections appended at the end
         report_path = os.path.join(proj.pm.root, "qa_report.md")
-        total = total_pass + total_warn + total_fail
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(f"# Visual Quality Report\n\n")
-            f.write(f"**Project**: {proj.project_data.get('title', '')}\n")
-            f.write(f"**Model**: {ai.model_name}\n")
-            f.write(f"**Total Scenes Analyzed**: {total}\n\n")
-            f.write(f"| Status | Count | Percentage |\n")
-            f.write(f"|--------|-------|------------|\n")
+        detail_buckets = {"FAIL": [], "WARN": []}
+        with open(report_path, "w", encoding="utf-8") as report:
+            report.write(f"# Visual Quality Report\n\n")
+            report.write(f"**Project**: {proj.project_data.get('title', '')}\n")
+            report.write(f"**Model**: {ai.model_name}\n\n")
+            report.write(f"## Scene-by-Scene Summary\n\n")
+            report.write(f"| Chapter | Scene | Score | Status | Action | Key Issue |\n")
+            report.write(f"|---------|-------|-------|--------|--------|-----------|\n")
+            report.flush()
+
+            for ch, header, jobs in chapter_jobs:
+                logger.info(header)
+                idx = ch["index"]
+
+                for scene_file, sid, job in jobs:
+                    analyzed_count += 1
+                    result = await job if isinstance(job, asyncio.Task) else job
+
+                    if result is None:
+                        logger.warning(f"   ⚠️ {scene_file}: Could not extract keyframe")
+                        continue
+
+                    status = result.get("status", "WARN")
+                    score = result.get("score", 5)
+                    issues = result.get("issues", [])
+                    recommendation = result.get("recommendation", "")
+
+                    icon = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌"}.get(status, "❓")
+                    pct = analyzed_count / total_scene_count * 100 if total_scene_count else 0
+                    logger.info(f"   {icon} [{analyzed_count}/{total_scene_count} ({pct:.0f}%)] {scene_file}: {status} (Score: {score}/10)")
+                    if issues:
+                        for issue in issues:
+                            logger.info(f"      → {issue}")
+
+                    if status == "PASS":
+                        total_pass += 1
+                    elif status == "WARN":
+                        total_warn += 1
+                    else:
+                        total_fail += 1
+
+                    action = {"PASS": "OK", "WARN": "Review", "FAIL": "**Regenerate**"}.get(status, "?")
+                    key_issue = issues[0][:60] if issues else "—"
+                    report.write(f"| ch{idx:02d} | {scene_file} | {score}/10 | {icon} {status} | {action} | {key_issue} |\n")
+                    report.flush()
+
+                    if status in detail_buckets:
+                        detail_buckets[status].append({
+                            "chapter": idx,
+                            "scene": scene_file,
+                            "score": score,
+                            "issues": issues,
+                            "recommendation": recommendation,
+                        })
+
+            total = total_pass + total_warn + total_fail
+            report.write(f"\n---\n\n")
+            report.write(f"**Total Scenes Analyzed**: {total}\n\n")
+            report.write(f"| Status | Count | Percentage |\n")
+            report.write(f"|--------|-------|------------|\n")
             if total > 0:
-                f.write(f"| ✅ PASS | {total_pass} | {total_pass/total*100:.0f}% |\n")
-                f.write(f"| ⚠️ WARN | {total_warn} | {total_warn/total*100:.0f}% |\n")
-                f.write(f"| ❌ FAIL | {total_fail} | {total_fail/total*100:.0f}% |\n")
-            f.write(f"\n---\n\n")
-
-            # Full summary table (user requested)
-            f.write(f"## Scene-by-Scene Summary\n\n")
-            f.write(f"| Chapter | Scene | Score | Status | Action | Key Issue |\n")
-            f.write(f"|---------|-------|-------|--------|--------|-----------|\n")
-            for r in qa_results:
-                icon = {"PASS": "✅", "WARN": "⚠️", "FAIL": "❌"}.get(r["status"], "❓")
-                action = {"PASS": "OK", "WARN": "Review", "FAIL": "**Regenerate**"}.get(r["status"], "?")
-                key_issue = r["issues"][0][:60] if r["issues"] else "—"
-                f.write(f"| ch{r['chapter']:02d} | {r['scene']} | {r['score']}/10 | {icon} {r['status']} | {action} | {key_issue} |\n")
-            f.write(f"\n---\n\n")
+                report.write(f"| ✅ PASS | {total_pass} | {total_pass/total*100:.0f}% |\n")
+                report.write(f"| ⚠️ WARN | {total_warn} | {total_warn/total*100:.0f}% |\n")
+                report.write(f"| ❌ FAIL | {total_fail} | {total_fail/total*100:.0f}% |\n")
+            report.write(f"\n---\n\n")
 
             # Detailed issues (FAIL first, then WARN)
-            for status_filter in ["FAIL", "WARN"]:
-                filtered = [r for r in qa_results if r["status"] == status_filter]
+            for status_filter, filtered in detail_buckets.items():
                 if not filtered:
                     continue
                 icon = {"WARN": "⚠️", "FAIL": "❌"}[status_filter]
-                f.write(f"## {icon} {status_filter} Details ({len(filtered)} scenes)\n\n")
+                report.write(f"## {icon} {status_filter} Details ({len(filtered)} scenes)\n\n")
                 for r in filtered:
-                    f.write(f"### ch{r['chapter']:02d} / {r['scene']} (Score: {r['score']}/10)\n")
+                    report.write(f"### ch{r['chapter']:02d} / {r['scene']} (Score: {r['score']}/10)\n")
                     if r["issues"]:
                         for issue in r["issues"]:
-                            f.write(f"- {issue}\n")
+                            report.write(f"- {issue}\n")
                     if r["recommendation"]:
-                        f.write(f"- **Recommendation**: {r['recommendation']}\n")
-                    f.write(f"\n")
+                        report.write(f"- **Recommendation**: {r['recommendation']}\n")
+                    report.write(f"\n")
 
         logger.info(f"\n📊 ═══ Visual QA Summary ═══")
         logger.info(f"✅ PASS: {total_pass}  ⚠️ WARN: {total_warn}  ❌ FAIL: {total_fail}")
@@ -2166,8 +2982,8 @@ async def main():
             logger.error(f"❌ shorts_script.json not found: {shorts_script_path}")
             return
 
-        with open(shorts_script_path, "r", encoding="utf-8") as f:
-            shorts_script = json.load(f)
+        with open(shorts_script_path, "rb") as f:
+            shorts_script = _loads_json(f.read())
 
         shorts_scenes = shorts_script.get("scenes", [])
         if not shorts_scenes:
@@ -2182,8 +2998,8 @@ async def main():
         mapping_path = os.path.join(assets_shorts_dir, "asset_mapping.json")
         asset_mapping = {}
         if os.path.exists(mapping_path):
-            with open(mapping_path, "r", encoding="utf-8") as f:
-                asset_mapping = json.load(f).get("scenes", {})
+            with open(mapping_path, "rb") as f:
+                asset_mapping = _loads_json(f.read()).get("scenes", {})
 
         # Create orchestrator in shorts mode
         orchestrator = BibleOrchestrator(
@@ -2249,7 +3065,7 @@ async def main():
                 shutil.copy2(src_vtt, dst_vtt)
 
             # Render
-            if orchestrator.render_scene(sid):
+            if await orchestrator.render_scene(sid):
                 success += 1
 
             # Restore original assets
@@ -2280,15 +3096,15 @@ async def main():
 
             # Generate project-level metadata
             logger.info("📦 Generating YouTube metadata...")
-            ai = AIClient()
+            ai = _ai_client()
             timestamps = proj.generate_chapter_timestamps()
             metadata = await ai.generate_project_metadata(
                 project_data=proj.project_data,
                 timestamps=timestamps,
             )
             metadata_path = proj.pm.metadata_file
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            with open(metadata_path, "wb") as f:
+                f.write(_dumps_json(metadata))
             logger.info(f"✅ Metadata saved: {metadata_path}")
         return
 
@@ -2307,8 +3123,8 @@ async def main():
             logger.error(f"❌ No script.json found at {script_path}")
             return
 
-        with open(script_path, "r", encoding="utf-8") as f:
-            script_data = json.load(f)
+        with open(script_path, "rb") as f:
+            script_data = _loads_json(f.read())
 
         scenes = script_data.get("scenes", [])
 
@@ -2323,8 +3139,8 @@ async def main():
                 scene["audio_priority"] = priority
                 updated += 1
 
-        with open(script_path, "w", encoding="utf-8") as f:
-            json.dump(script_data, f, ensure_ascii=False, indent=2)
+        with open(script_path, "wb") as f:
+            f.write(_dumps_json(script_data))
 
         logger.info(f"✅ Updated {updated} scenes to audio_priority='{priority}'")
         for scene in scenes:
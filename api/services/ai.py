@@ -262,10 +262,14 @@ class AIClient:
 
         return scenes
 
-    async def generate_metadata(self, script: dict, plan: dict) -> dict:
-        """Generate YouTube metadata (titles, description, hashtags)."""
+    async def generate_metadata(self, script: dict, plan: dict) -> tuple:
+        """
+        Generate YouTube metadata (titles, description, hashtags).
+        Returns (metadata, is_fallback); is_fallback is True when the AI was
+        unavailable or failed and the static fallback metadata was returned.
+        """
         if not self.client:
-            return self._fallback_metadata(plan)
+            return self._fallback_metadata(plan), True
 
         from google.genai import types
 
@@ -311,11 +315,11 @@ class AIClient:
                 )
 
             response = await self._retry_call(_call)
-            return json.loads(response.text)
+            return json.loads(response.text), False
 
         except Exception as e:
             logger.error(f"Metadata generation failed: {e}")
-            return self._fallback_metadata(plan)
+            return self._fallback_metadata(plan), True
 
     # ---- Project (Long-Form) Methods ----
 
@@ -745,9 +749,11 @@ Reply ONLY with JSON array (no markdown):
 
     # ---- Visual Quality Analysis ----
 
-    async def analyze_scene_quality(self, image_path: str, scene_context: str = "", video_prompt: str = "") -> dict:
+    async def analyze_scene_quality(self, image_path: str, scene_context: str = "", video_prompt: str = "",
+                                    image_bytes: Optional[bytes] = None) -> dict:
         """
         Analyze a scene keyframe for visual quality issues using Gemini 3 Flash.
+        image_bytes: JPEG already in memory; when given, image_path is not read.
         Returns: {"status": "PASS"|"WARN"|"FAIL", "issues": [...], "score": 1-10}
         """
         if not self.client:
@@ -757,12 +763,13 @@ Reply ONLY with JSON array (no markdown):
         from google.genai import types
         import base64
 
-        if not os.path.exists(image_path):
-            return {"status": "FAIL", "issues": [f"Image not found: {image_path}"], "score": 0}
+        if image_bytes is None:
+            if not os.path.exists(image_path):
+                return {"status": "FAIL", "issues": [f"Image not found: {image_path}"], "score": 0}
 
-        # Read image as base64
-        with open(image_path, "rb") as f:
-            image_bytes = f.read()
+            # Read image as base64
+            with open(image_path, "rb") as f:
+                image_bytes = f.read()
 
         prompt = f"""You are a professional visual quality assurance inspector for 3D animated Bible videos 
 (Pixar/Disney style). Analyze this frame and rate its quality.
@@ -260,3 +260,100 @@ def create_simple_vtt(text: str, audio_path: str, vtt_path: str):
         f.write(vtt_content)
 
     logger.info(f"✅ Simple VTT created: {os.path.basename(vtt_path)}")
+
+
+# libavcodec's default ASS header for converted text subtitles (what the
+# `subtitles` filter renders VTT with), so force_style overrides apply the same
+_ASS_STYLE_FIELDS = [
+    "Name", "Fontname", "Fontsize", "PrimaryColour", "SecondaryColour",
+    "OutlineColour", "BackColour", "Bold", "Italic", "Underline", "StrikeOut",
+    "ScaleX", "ScaleY", "Spacing", "Angle", "BorderStyle", "Outline", "Shadow",
+    "Alignment", "MarginL", "MarginR", "MarginV", "Encoding",
+]
+_ASS_DEFAULT_STYLE = [
+    "Default", "Arial", "16", "&Hffffff", "&Hffffff", "&H0", "&H0",
+    "0", "0", "0", "0", "100", "100", "0", "0", "1", "1", "0", "2",
+    "10", "10", "10", "1",
+]
+_VTT_TIMING_RE = re.compile(
+    r'((?:\d+:)?\d{1,2}:\d{2}\.\d{3})\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}\.\d{3})'
+)
+
+
+def _vtt_time_to_cs(ts: str) -> int:
+    """'HH:MM:SS.mmm' or 'MM:SS.mmm' → centiseconds (rounded)."""
+    *hm, sec = ts.split(":")
+    s, ms = sec.split(".")
+    total = 0
+    for part in hm:
+        total = total * 60 + int(part)
+    total_ms = (total * 60 + int(s)) * 1000 + int(ms)
+    return (total_ms + 5) // 10
+
+
+def _cs_to_ass_time(cs: int) -> str:
+    """Centiseconds → ASS 'H:MM:SS.cc'."""
+    s, cs = divmod(cs, 100)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}.{cs:02d}"
+
+
+def create_ass_from_vtt(vtt_path: str, ass_path: str, force_style: str = "",
+                        source_key: str = "") -> bool:
+    """
+    Convert a WebVTT file to ASS with force_style ("Key=Value,...") baked into
+    the Default style, for the `ass` filter. A non-empty source_key is recorded
+    as a "; Source:" comment in [Script Info] so callers can check freshness.
+    Returns False if no cues were found.
+    """
+    with open(vtt_path, "r", encoding="utf-8") as f:
+        blocks = re.split(r'\n\s*\n', f.read().replace("\r\n", "\n"))
+
+    events = []
+    for block in blocks:
+        lines = block.strip("\n").split("\n")
+        for i, line in enumerate(lines):
+            m = _VTT_TIMING_RE.search(line)
+            if not m:
+                continue
+            text_lines = [
+                t.strip().replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
+                for t in lines[i + 1:] if t.strip()
+            ]
+            if text_lines:
+                text = "\\N".join(text_lines)
+                start = _cs_to_ass_time(_vtt_time_to_cs(m.group(1)))
+                end = _cs_to_ass_time(_vtt_time_to_cs(m.group(2)))
+                events.append(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}")
+            break
+    if not events:
+        return False
+
+    style = dict(zip(_ASS_STYLE_FIELDS, _ASS_DEFAULT_STYLE))
+    for item in filter(None, force_style.split(",")):
+        key, _, value = item.partition("=")
+        key = {"FontSize": "Fontsize"}.get(key.strip(), key.strip())
+        if key in style:
+            style[key] = value.strip()
+
+    content = "\n".join([
+        "[Script Info]",
+        *([f"; Source: {source_key}"] if source_key else []),
+        "ScriptType: v4.00+",
+        "PlayResX: 384",
+        "PlayResY: 288",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: " + ", ".join(_ASS_STYLE_FIELDS),
+        "Style: " + ",".join(style[k] for k in _ASS_STYLE_FIELDS),
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        *events,
+        "",
+    ])
+    with open(ass_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True